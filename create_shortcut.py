@@ -1,26 +1,40 @@
 """Create a desktop shortcut for game."""
 
+import hashlib
 import os
 import sys
 from pathlib import Path
 
-import yaml
 
-import win32com.client
-from PIL import Image
+def _icon_fingerprint(icon_path: Path) -> str:
+    """Fingerprint the icon source by content hash and mtime."""
+    digest = hashlib.blake2b(icon_path.read_bytes(), digest_size=16).hexdigest()
+    return f"{digest}{icon_path.stat().st_mtime_ns}"
 
 
 def png_to_ico(png_path: Path, ico_path: Path) -> None:
     """Convert PNG image to ICO format for Windows shortcut."""
+    # Imported lazily so merely importing this script doesn't load Pillow
+    from PIL import Image
+
     img = Image.open(png_path)
+    # Shrink-on-load: for JPEG sources this lets libjpeg decode at a reduced
+    # DCT scale close to the target size (no-op for PNG)
+    img.draft(img.mode, (256, 256))
     # Resize to common icon sizes
     img = img.convert("RGBA")
-    # Create ICO with multiple sizes
+    # Create ICO with multiple sizes. Only the first (largest) size is
+    # resampled with Lanczos from the full-resolution source; each smaller
+    # size is a cheap box downscale of the previous result instead of
+    # re-running Lanczos over the original pixels.
     sizes = [(256, 256), (128, 128), (64, 64), (48, 48), (32, 32), (16, 16)]
     imgs = []
+    resized = img.copy()
+    resized.thumbnail(sizes[0], Image.Resampling.LANCZOS)
     for size in sizes:
-        resized = img.copy()
-        resized.thumbnail(size, Image.Resampling.LANCZOS)
+        if resized.width > size[0] or resized.height > size[1]:
+            resized = resized.copy()
+            resized.thumbnail(size, Image.Resampling.BOX)
         # Create a new image with exact size and paste centered
         new_img = Image.new("RGBA", size, (0, 0, 0, 0))
         offset = ((size[0] - resized.width) // 2, (size[1] - resized.height) // 2)
@@ -28,13 +42,17 @@ def png_to_ico(png_path: Path, ico_path: Path) -> None:
         imgs.append(new_img)
 
     # Save as ICO
-    imgs[0].save(
-        ico_path, format="ICO", sizes=[img.size for img in imgs], append_images=imgs[1:]
-    )
+    # Each canvas was created at exactly sizes[i], so reuse the list as-is
+    imgs[0].save(ico_path, format="ICO", sizes=sizes, append_images=imgs[1:])
 
 
 def create_shortcut():
     """Create desktop shortcut for game."""
+    # Imported lazily so the heavy COM machinery only loads when actually
+    # creating a shortcut
+    import win32com.client
+    import yaml
+
     # Get project root directory
     project_root = Path(__file__).parent.resolve()
 
@@ -63,12 +81,27 @@ def create_shortcut():
         if not icon_path.exists():
             print(f"Warning: Icon image not found at {icon_path}")
             ico_path = None
+        elif icon_path.suffix.lower() == ".ico":
+            # Already an ICO — use it directly, no conversion needed
+            ico_path = icon_path
         else:
-            # Convert PNG to ICO in the same folder as the source image
+            # Convert PNG to ICO in the same folder as the source image.
+            # Skip the conversion when the source is unchanged since the
+            # last run (fingerprint stored next to the ICO).
             ico_path = icon_path.with_suffix(".ico")
-            print(f"Converting {icon_path} to ICO format...")
-            png_to_ico(icon_path, ico_path)
-            print(f"Created icon: {ico_path}")
+            meta_path = ico_path.with_suffix(".meta")
+            fingerprint = _icon_fingerprint(icon_path)
+            if (
+                ico_path.exists()
+                and meta_path.exists()
+                and meta_path.read_text(encoding="utf-8") == fingerprint
+            ):
+                print(f"Icon up to date: {ico_path}")
+            else:
+                print(f"Converting {icon_path} to ICO format...")
+                png_to_ico(icon_path, ico_path)
+                meta_path.write_text(fingerprint, encoding="utf-8")
+                print(f"Created icon: {ico_path}")
 
     # Find Python executable in .venv
     venv_python = project_root / ".venv" / "Scripts" / "python.exe"
@@ -77,11 +110,17 @@ def create_shortcut():
         print("Please create a .venv first: python -m venv .venv")
         sys.exit(1)
 
-    # Get desktop path
-    desktop = Path(os.path.expanduser("~")) / "Desktop"
-    if not desktop.exists():
-        # Try OneDrive desktop
-        desktop = Path(os.path.expanduser("~")) / "OneDrive" / "Desktop"
+    # Get desktop path from the Windows shell API — authoritative even when
+    # OneDrive has redirected the Desktop folder
+    try:
+        from win32com.shell import shell, shellcon
+
+        desktop = Path(shell.SHGetFolderPath(0, shellcon.CSIDL_DESKTOPDIRECTORY, 0, 0))
+    except Exception:
+        # Fall back to the conventional locations
+        desktop = Path(os.path.expanduser("~")) / "Desktop"
+        if not desktop.exists():
+            desktop = Path(os.path.expanduser("~")) / "OneDrive" / "Desktop"
     if not desktop.exists():
         print(f"Error: Desktop folder not found")
         sys.exit(1)
@@ -1,14 +1,30 @@
 """Configuration loader for MyMath game."""
 
+import functools
 import os
+import pickle
+from functools import cached_property
 from pathlib import Path
 from typing import Any
 
 import yaml
 
+# Prefer the LibYAML C loader when available (much faster than the pure-Python one)
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
 
+
+@functools.cache
 def get_project_root() -> Path:
-    """Get the project root directory."""
+    """Get the project root directory (cached for the process lifetime)."""
+    # Canonical layout first: this file lives at <root>/src/my_math/config.py
+    this_file = Path(__file__).resolve()
+    project_root = this_file.parent.parent.parent
+    if (project_root / "config.yaml").exists():
+        return project_root
+
     # Try to find config.yaml starting from current directory and going up
     current = Path.cwd()
 
@@ -24,12 +40,6 @@ def get_project_root() -> Path:
     if current.name == "src" and (current.parent / "config.yaml").exists():
         return current.parent
 
-    # Try the directory of this file
-    this_file = Path(__file__).resolve()
-    project_root = this_file.parent.parent.parent
-    if (project_root / "config.yaml").exists():
-        return project_root
-
     # Default to current directory
     return current
 
@@ -54,8 +64,68 @@ class Config:
         if not self.config_path.exists():
             raise FileNotFoundError(f"Configuration file not found: {self.config_path}")
 
-        with open(self.config_path, "r", encoding="utf-8") as f:
-            self._config = yaml.safe_load(f)
+        self._config = self._load_cached()
+        if self._config is None:
+            with open(self.config_path, "r", encoding="utf-8") as f:
+                self._config = yaml.load(f, Loader=_SafeLoader)
+            self._write_cache()
+
+        self._flat: dict[str, Any] = {}
+        self._flatten(self._config)
+        self._paths: dict[str, Path] = {}
+
+    def _flatten(self, config: dict, prefix: str = "") -> None:
+        """Flatten the nested config into dot-notation keys for O(1) lookups.
+
+        Both leaf values and intermediate dicts are stored, so `get` keeps
+        returning sub-dicts for non-leaf keys.
+
+        Args:
+            config: The (sub-)dict to flatten
+            prefix: Dot-notation prefix of the current nesting level
+        """
+        for k, v in config.items():
+            key = f"{prefix}{k}"
+            self._flat[key] = v
+            if isinstance(v, dict):
+                self._flatten(v, f"{key}.")
+
+    def _cache_path(self) -> Path:
+        """Get the path of the pickled config cache next to the YAML file."""
+        return self.config_path.with_suffix(".cache.pkl")
+
+    def _load_cached(self) -> dict | None:
+        """Load the pickled config cache if it matches the YAML file's mtime.
+
+        The cache file stores the YAML file's st_mtime_ns as an 8-byte header
+        followed by the pickled config dict. A stale or unreadable cache is
+        silently ignored.
+
+        Returns:
+            The cached config dict, or None if no valid cache exists
+        """
+        try:
+            mtime_ns = self.config_path.stat().st_mtime_ns
+            with open(self._cache_path(), "rb") as f:
+                header = f.read(8)
+                if header != mtime_ns.to_bytes(8, "little", signed=True):
+                    return None
+                cached = pickle.load(f)
+            return cached if isinstance(cached, dict) else None
+        except (OSError, pickle.PickleError, EOFError):
+            return None
+
+    def _write_cache(self) -> None:
+        """Write the parsed config to the pickle cache (best effort)."""
+        try:
+            mtime_ns = self.config_path.stat().st_mtime_ns
+            tmp_path = self._cache_path().with_suffix(".pkl.tmp")
+            with open(tmp_path, "wb") as f:
+                f.write(mtime_ns.to_bytes(8, "little", signed=True))
+                f.write(pickle.dumps(self._config, protocol=pickle.HIGHEST_PROTOCOL))
+            os.replace(tmp_path, self._cache_path())
+        except OSError:
+            pass  # Cache is an optimization only; never fail startup over it
 
     def get(self, key: str, default: Any = None) -> Any:
         """Get a configuration value by key (supports nested keys with dot notation).
@@ -67,16 +137,9 @@ class Config:
         Returns:
             The configuration value or default
         """
-        keys = key.split(".")
-        value = self._config
-
-        for k in keys:
-            if isinstance(value, dict) and k in value:
-                value = value[k]
-            else:
-                return default
-
-        return value
+        if key in self._flat:
+            return self._flat[key]
+        return default
 
     def get_path(self, key: str, default: str = "") -> Path:
         """Get a path configuration value, resolved relative to project root.
@@ -88,63 +151,72 @@ class Config:
         Returns:
             Resolved Path object
         """
+        cached = self._paths.get(key)
+        if cached is not None:
+            return cached
+
         path_str = self.get(key, default)
-        if not path_str:
-            return Path(default)
-        return self.project_root / path_str
+        path = Path(default) if not path_str else self.project_root / path_str
+        self._paths[key] = path
+        return path
 
-    @property
+    @cached_property
     def title(self) -> str:
         """Get the game title."""
         return self.get("title", "MyMath")
 
-    @property
+    @cached_property
     def images_folder(self) -> Path:
         """Get the images folder path."""
         return self.get_path("images_folder", "data/images")
 
-    @property
+    @cached_property
     def sound_enabled(self) -> bool:
         """Check if sound is enabled."""
         return self.get("sound.enabled", True)
 
-    @property
+    @cached_property
     def correct_sound_folder(self) -> Path:
         """Get the correct answer sounds folder path."""
         return self.get_path("sound.correct_sound", "data/reactions")
 
-    @property
+    @cached_property
     def fullscreen(self) -> bool:
         """Check if fullscreen mode is enabled."""
         return self.get("window.fullscreen", False)
 
     # Game settings (shared across all game modes)
-    @property
+    @cached_property
     def game_max_number(self) -> int:
         """Get the maximum number for games."""
         return self.get("game.max_number", 10)
 
-    @property
+    @cached_property
     def game_rounds(self) -> int:
         """Get the number of rounds per game."""
         return self.get("game.rounds", 10)
 
-    @property
+    @cached_property
     def game_image_size(self) -> int:
         """Get the image size for games."""
         return self.get("game.image_size", 100)
 
-    @property
+    @cached_property
     def game_delay(self) -> int:
         """Get the delay between steps in milliseconds."""
         return self.get("game.delay_ms", 1500)
 
-    @property
+    @cached_property
     def game_button_color(self) -> str:
         """Get the button color for game modes."""
         return self.get("game.button_color", "#3498db")
 
-    @property
+    @cached_property
+    def game_resample(self) -> str:
+        """Get the resampling filter name for per-round image resizing."""
+        return self.get("game.resample", "bilinear")
+
+    @cached_property
     def game_group_gap(self) -> int:
         """Get the gap in pixels between groups of 5 when displaying 10 images."""
         return self.get("game.group_gap", 15)
@@ -165,8 +237,18 @@ class Config:
                 config[k] = {}
             config = config[k]
 
-        # Set the value
+        # Set the value and refresh the flattened lookup table
         config[keys[-1]] = value
+        self._flat.clear()
+        self._flatten(self._config)
+        self._paths.clear()
+        self._invalidate_property_cache()
+
+    def _invalidate_property_cache(self) -> None:
+        """Drop all memoized cached_property values after a config change."""
+        for name, attr in type(self).__dict__.items():
+            if isinstance(attr, cached_property):
+                self.__dict__.pop(name, None)
 
     def save(self) -> None:
         """Save the current configuration to the YAML file."""
@@ -178,18 +260,19 @@ class Config:
                 allow_unicode=True,
                 sort_keys=False,
             )
+        self._write_cache()
 
-    @property
+    @cached_property
     def videos_folder(self) -> Path:
         """Get the videos folder path."""
         return self.get_path("video.videos_folder", "data/videos")
 
-    @property
+    @cached_property
     def video_min_rounds(self) -> int:
         """Get minimum rounds needed for video reward."""
         return self.get("video.min_rounds", 7)
 
-    @property
+    @cached_property
     def video_max_wrong(self) -> int:
         """Get maximum wrong answers allowed for video reward."""
         return self.get("video.max_wrong", 1)
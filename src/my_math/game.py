@@ -3,7 +3,10 @@
 import os
 import random
 import sys
+import threading
 import tkinter as tk
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache, partial
 from importlib.metadata import version as pkg_version
 from pathlib import Path
 from tkinter import filedialog
@@ -14,6 +17,12 @@ from PIL import Image, ImageTk
 
 from .config import get_config, Config
 
+# winsound only exists on Windows; probe once at import time
+if sys.platform == "win32":
+    import winsound
+else:
+    winsound = None
+
 # Try to import VLC
 try:
     import vlc
@@ -22,20 +31,206 @@ try:
 except ImportError:
     VLC_AVAILABLE = False
 
+# Recognized media file extensions (lowercase, without the dot)
+_IMAGE_EXTS = frozenset({"png", "jpg", "jpeg", "gif", "bmp"})
+_VIDEO_EXTS = frozenset({"mp4", "avi", "mkv", "mov", "wmv", "webm"})
+_SOUND_EXTS = frozenset({"wav", "mp3", "ogg"})
+
+
+# Cached folder listings keyed by path, invalidated when the directory's
+# mtime changes; shared across all players/views
+_scan_cache: dict[tuple[str, frozenset[str]], tuple[int, list[Path]]] = {}
+
+
+# Shared UI colors
+_BG = "#f0f0f0"  # Window/background gray
+_BOARD_BG = "#ecf0f1"  # Image board background
+
+# Circle colors for the no-images fallback shapes
+_COLORS = ("#e74c3c", "#3498db", "#2ecc71", "#f39c12", "#9b59b6")
+
+# Shared options for the large menu-style buttons
+_BUTTON_BASE = {
+    "width": 15,
+    "height": 2,
+    "relief": "flat",
+    "cursor": "hand2",
+    "fg": "white",
+    "activeforeground": "white",
+}
+
+
+# Shared Tk font cache; font creation round-trips to Tcl and is costly
+_FONTS: dict[tuple[str, int, str], tkfont.Font] = {}
+
+
+def _font(family: str, size: int, weight: str = "normal") -> tkfont.Font:
+    """Get a shared tkfont.Font instance, creating it on first use."""
+    key = (family, size, weight)
+    font = _FONTS.get(key)
+    if font is None:
+        font = tkfont.Font(family=family, size=size, weight=weight)
+        _FONTS[key] = font
+    return font
+
+
+# Resampling filters by config name. Bilinear is the default for the small
+# per-round images: several times faster than Lanczos with no visible
+# difference at the displayed sizes.
+_RESAMPLE_FILTERS = {
+    "nearest": Image.Resampling.NEAREST,
+    "bilinear": Image.Resampling.BILINEAR,
+    "bicubic": Image.Resampling.BICUBIC,
+    "lanczos": Image.Resampling.LANCZOS,
+}
+
+
+@lru_cache(maxsize=32)
+def _resized_rgba(
+    path_str: str,
+    mtime_ns: int,
+    width: int,
+    height: int,
+    resample: str = "bilinear",
+) -> Image.Image:
+    """Load an image and resize it, cached across rounds.
+
+    Keyed by path, mtime and target size so re-picking the same image at the
+    same size skips both the decode and the resample.
+    """
+    img = Image.open(path_str)
+    # Shrink-on-load: JPEG sources decode at a reduced DCT scale close to the
+    # target size (no-op for other formats)
+    img.draft(img.mode, (width, height))
+    img = img.convert("RGBA")
+    resample_filter = _RESAMPLE_FILTERS.get(resample, Image.Resampling.BILINEAR)
+    return img.resize((width, height), resample_filter)
+
+
+# Single background worker for image decode + resize. PIL releases the GIL
+# during decode and resample, so this genuinely overlaps with the Tk main
+# loop; PhotoImage creation still happens on the Tk thread.
+_decode_executor = ThreadPoolExecutor(max_workers=1)
+
+
+@lru_cache(maxsize=256)
+def _grid_image_size(
+    groups: tuple[int, ...],
+    count: int,
+    frame_width: int,
+    frame_height: int,
+    base_size: int,
+) -> int:
+    """Image size for the counting grid; pure in its inputs, so memoized."""
+    if frame_height < 50:  # Frame not yet sized
+        frame_height = 400
+    if frame_width < 50:
+        frame_width = 800
+
+    num_rows = len(groups) if groups else 1
+    max_cols = max(groups) if groups else count
+
+    # Calculate max size that fits vertically (with padding)
+    vertical_padding = 10 * (num_rows + 1)  # pady between rows
+    max_height_per_image = (
+        (frame_height - vertical_padding) // num_rows if num_rows > 0 else base_size
+    )
+
+    # Calculate max size that fits horizontally (with padding)
+    horizontal_padding = 6 * (max_cols + 1)  # padx between columns
+    max_width_per_image = (
+        (frame_width - horizontal_padding) // max_cols if max_cols > 0 else base_size
+    )
+
+    # Use the smaller of the two to ensure it fits
+    calculated_size = min(max_height_per_image, max_width_per_image, base_size)
+
+    # Ensure minimum size
+    return max(30, int(calculated_size * 0.9))  # 90% to leave some margin
+
+
+@lru_cache(maxsize=256)
+def _addition_image_size(
+    max_group: int, frame_width: int, frame_height: int, base_size: int
+) -> int:
+    """Image size for the addition layout; pure in its inputs, so memoized."""
+    if frame_height < 50:  # Frame not yet sized
+        frame_height = 400
+    if frame_width < 50:
+        frame_width = 800
+
+    # For addition view: numbers on top row, images below
+    # Estimate: 2 rows max for images, need space for number labels (~80px) and plus/equals
+    available_height = frame_height - 100  # Reserve for number labels
+    max_rows = max(1, (max_group + 4) // 5)  # Up to 5 per row
+    max_height_per_image = available_height // max(max_rows, 1)
+
+    # Width: need to fit both number groups + plus + equals + question
+    # Each group max 5 wide, plus symbols take ~200px
+    available_width = frame_width - 250  # Reserve for +, =, ?
+    max_width_per_image = available_width // 10  # 5 per group, 2 groups
+
+    # Use the smaller of the two to ensure it fits
+    calculated_size = min(max_height_per_image, max_width_per_image, base_size)
+
+    # Ensure minimum size
+    return max(30, int(calculated_size * 0.85))
+
+
+def _list_by_ext(folder: Path, exts: frozenset[str]) -> list[Path]:
+    """List files in a folder whose extension is in the given set.
+
+    Single os.scandir pass instead of one glob per extension. Results are
+    cached until the folder's mtime changes, so repeated rounds cost one
+    stat() call instead of a directory scan.
+    """
+    key = (str(folder), exts)
+    try:
+        mtime_ns = os.stat(folder).st_mtime_ns
+    except OSError:
+        _scan_cache.pop(key, None)
+        return []
+
+    cached = _scan_cache.get(key)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1]
+
+    try:
+        with os.scandir(folder) as it:
+            files = [
+                Path(entry.path)
+                for entry in it
+                if entry.is_file(follow_symlinks=False)
+                and entry.name.rpartition(".")[2].lower() in exts
+            ]
+    except OSError:
+        return []
+
+    _scan_cache[key] = (mtime_ns, files)
+    return files
+
 
 class VideoPlayer:
     """Video player using VLC for tkinter embedding."""
 
     _vlc_instance = None  # Shared VLC instance (expensive to create)
+    _vlc_lock = threading.Lock()  # Guards _vlc_instance creation
 
     @classmethod
     def warmup(cls) -> None:
         """Pre-initialize the VLC instance so first playback is instant."""
-        if VLC_AVAILABLE and cls._vlc_instance is None:
-            try:
-                cls._vlc_instance = vlc.Instance()
-            except Exception:
-                cls._vlc_instance = None
+        if VLC_AVAILABLE:
+            with cls._vlc_lock:
+                if cls._vlc_instance is None:
+                    try:
+                        cls._vlc_instance = vlc.Instance()
+                    except Exception:
+                        cls._vlc_instance = None
+
+    @classmethod
+    def warmup_async(cls) -> None:
+        """Run warmup on a daemon thread so the UI never waits for VLC."""
+        threading.Thread(target=cls.warmup, daemon=True).start()
 
     def __init__(self, parent: tk.Widget, config: Config):
         self.parent = parent
@@ -47,10 +242,11 @@ class VideoPlayer:
 
         if VLC_AVAILABLE:
             try:
-                # Reuse the shared VLC instance
-                if VideoPlayer._vlc_instance is None:
-                    VideoPlayer._vlc_instance = vlc.Instance()
-                self.instance = VideoPlayer._vlc_instance
+                # Reuse the shared VLC instance (create it if warmup hasn't)
+                with VideoPlayer._vlc_lock:
+                    if VideoPlayer._vlc_instance is None:
+                        VideoPlayer._vlc_instance = vlc.Instance()
+                    self.instance = VideoPlayer._vlc_instance
                 self.player = self.instance.media_player_new()
             except Exception:
                 self.instance = None
@@ -58,12 +254,7 @@ class VideoPlayer:
 
     def _load_available_videos(self) -> None:
         """Load list of available videos from the videos folder."""
-        videos_folder = self.config.videos_folder
-        self._available_videos = []
-
-        if videos_folder.exists():
-            for ext in ["*.mp4", "*.avi", "*.mkv", "*.mov", "*.wmv", "*.webm"]:
-                self._available_videos.extend(videos_folder.glob(ext))
+        self._available_videos = _list_by_ext(self.config.videos_folder, _VIDEO_EXTS)
 
     def get_random_video(self) -> Path | None:
         """Get a random video from the videos folder."""
@@ -118,41 +309,31 @@ class SoundPlayer:
 
     def __init__(self, enabled: bool = True):
         self.enabled = enabled
-        self._winsound_available = False
-
-        if enabled:
-            try:
-                import winsound
-
-                self._winsound_available = True
-            except ImportError:
-                pass
+        self._winsound_available = enabled and winsound is not None
 
     def play(self, sound_path: Path) -> None:
         """Play a sound file."""
-        if not self.enabled or not sound_path.exists():
+        if not self.enabled:
             return
 
+        # No exists() check: callers pass paths from the cached folder
+        # listing, and SND_NODEFAULT keeps a stale path silent instead of
+        # playing the system default sound
         try:
             if self._winsound_available:
-                import winsound
-
                 winsound.PlaySound(
-                    str(sound_path), winsound.SND_FILENAME | winsound.SND_ASYNC
+                    str(sound_path),
+                    winsound.SND_FILENAME | winsound.SND_ASYNC | winsound.SND_NODEFAULT,
                 )
         except Exception:
             pass  # Silently fail if sound can't be played
 
     def play_random_from_folder(self, folder_path: Path) -> None:
         """Play a random sound file from a folder."""
-        if not self.enabled or not folder_path.exists():
+        if not self.enabled:
             return
 
-        # Find all sound files in the folder
-        sound_files = []
-        for ext in ["*.wav", "*.mp3", "*.ogg"]:
-            sound_files.extend(folder_path.glob(ext))
-
+        sound_files = _list_by_ext(folder_path, _SOUND_EXTS)
         if sound_files:
             sound_path = random.choice(sound_files)
             self.play(sound_path)
@@ -165,7 +346,7 @@ class BaseView(tk.Frame):
         super().__init__(parent)
         self.controller = controller
         self.config = controller.config
-        self.configure(bg="#f0f0f0")
+        self.configure(bg=_BG)
 
     def show(self) -> None:
         """Called when this view is shown."""
@@ -179,10 +360,28 @@ class BaseView(tk.Frame):
 class MainMenuView(BaseView):
     """Main menu view with game mode selection."""
 
+    # Resized menu icons keyed by (path, mtime, size) so view rebuilds skip
+    # the decode + Lanczos resize
+    _icon_cache: dict[tuple[str, int, int], ImageTk.PhotoImage] = {}
+
     def __init__(self, parent: tk.Widget, controller: "GameController"):
         super().__init__(parent, controller)
         self._setup_ui()
 
+    @classmethod
+    def _load_icon(cls, icon_path: Path, size: int) -> ImageTk.PhotoImage:
+        """Load the menu icon at the given size, cached by path and mtime."""
+        key = (str(icon_path), icon_path.stat().st_mtime_ns, size)
+        photo = cls._icon_cache.get(key)
+        if photo is None:
+            img = Image.open(icon_path)
+            # Let JPEG sources decode at a reduced scale (no-op for PNG)
+            img.draft(img.mode, (size, size))
+            img = img.resize((size, size), Image.Resampling.LANCZOS)
+            photo = ImageTk.PhotoImage(img)
+            cls._icon_cache[key] = photo
+        return photo
+
     def _setup_ui(self) -> None:
         """Set up the main menu UI."""
         # Configure grid
@@ -192,7 +391,7 @@ class MainMenuView(BaseView):
         self.grid_rowconfigure(2, weight=1)
 
         # Header frame with icon and title side by side
-        header_frame = tk.Frame(self, bg="#f0f0f0")
+        header_frame = tk.Frame(self, bg=_BG)
         header_frame.grid(row=0, column=0, pady=(50, 30))
 
         # Icon image
@@ -200,50 +399,43 @@ class MainMenuView(BaseView):
         icon_path = self.config.get_path("icon_image")
         if icon_path.exists():
             try:
-                img = Image.open(icon_path)
-                img = img.resize((150, 150), Image.Resampling.LANCZOS)
-                self.icon_image = ImageTk.PhotoImage(img)
-                icon_label = tk.Label(header_frame, image=self.icon_image, bg="#f0f0f0")
+                self.icon_image = self._load_icon(icon_path, 150)
+                icon_label = tk.Label(header_frame, image=self.icon_image, bg=_BG)
                 icon_label.pack(side="left", padx=(0, 20))
             except Exception:
                 pass
 
         # Title
-        title_font = tkfont.Font(family="Arial", size=48, weight="bold")
+        title_font = _font("Arial", 48, "bold")
         self.title_label = tk.Label(
             header_frame,
             text=self.config.title,
             font=title_font,
-            bg="#f0f0f0",
+            bg=_BG,
             fg="#2c3e50",
         )
         self.title_label.pack(side="left")
 
         # Button frame
-        button_frame = tk.Frame(self, bg="#f0f0f0")
+        button_frame = tk.Frame(self, bg=_BG)
         button_frame.grid(row=1, column=0, pady=20)
 
         # Button style
         button_color = self.config.game_button_color
         # Calculate darker shade for active state
-        button_font = tkfont.Font(family="Arial", size=24, weight="bold")
+        button_font = _font("Arial", 24, "bold")
         button_config = {
+            **_BUTTON_BASE,
             "font": button_font,
-            "width": 15,
-            "height": 2,
-            "relief": "flat",
-            "cursor": "hand2",
             "bg": button_color,
-            "fg": "white",
             "activebackground": button_color,
-            "activeforeground": "white",
         }
 
         # Counting game button
         self.counting_btn = tk.Button(
             button_frame,
             text="🔢  1 2 3",
-            command=lambda: self.controller.show_view("counting"),
+            command=partial(self.controller.show_view, "counting"),
             **button_config,
         )
         self.counting_btn.pack(pady=15)
@@ -252,7 +444,7 @@ class MainMenuView(BaseView):
         self.game2_btn = tk.Button(
             button_frame,
             text="➕",
-            command=lambda: self.controller.show_view("addition"),
+            command=partial(self.controller.show_view, "addition"),
             **button_config,
         )
         self.game2_btn.pack(pady=15)
@@ -270,7 +462,7 @@ class MainMenuView(BaseView):
             fg="white",
             activebackground="#8e44ad",
             activeforeground="white",
-            command=lambda: self.controller.show_view("settings"),
+            command=partial(self.controller.show_view, "settings"),
         )
         self.settings_btn.pack(pady=15)
 
@@ -296,12 +488,12 @@ class MainMenuView(BaseView):
             ver = pkg_version("my_math")
         except Exception:
             ver = "?"
-        version_font = tkfont.Font(family="Arial", size=9)
+        version_font = _font("Arial", 9)
         version_label = tk.Label(
             self,
             text=f"v{ver}",
             font=version_font,
-            bg="#f0f0f0",
+            bg=_BG,
             fg="#aaaaaa",
         )
         version_label.grid(row=2, column=0, pady=(0, 10), sticky="s")
@@ -317,6 +509,8 @@ class SettingsView(BaseView):
     def __init__(self, parent: tk.Widget, controller: "GameController"):
         super().__init__(parent, controller)
         self.entries: dict[str, tk.Widget] = {}
+        self._scroll_dirty = False
+        self._last_bbox: tuple[int, int, int, int] | None = None
         self._setup_ui()
 
     def _setup_ui(self) -> None:
@@ -325,11 +519,11 @@ class SettingsView(BaseView):
         self.grid_rowconfigure(1, weight=1)
 
         # Header with back button
-        header = tk.Frame(self, bg="#f0f0f0")
+        header = tk.Frame(self, bg=_BG)
         header.grid(row=0, column=0, sticky="ew", padx=20, pady=10)
         header.grid_columnconfigure(1, weight=1)
 
-        back_font = tkfont.Font(family="Arial", size=14)
+        back_font = _font("Arial", 14)
         self.back_btn = tk.Button(
             header,
             text="⬅️",
@@ -338,16 +532,16 @@ class SettingsView(BaseView):
             fg="white",
             relief="flat",
             cursor="hand2",
-            command=lambda: self.controller.show_view("main_menu"),
+            command=partial(self.controller.show_view, "main_menu"),
         )
         self.back_btn.grid(row=0, column=0, sticky="w")
 
-        title_font = tkfont.Font(family="Arial", size=24, weight="bold")
+        title_font = _font("Arial", 24, "bold")
         title_label = tk.Label(
             header,
             text="⚙️ Settings",
             font=title_font,
-            bg="#f0f0f0",
+            bg=_BG,
             fg="#2c3e50",
         )
         title_label.grid(row=0, column=1)
@@ -366,21 +560,18 @@ class SettingsView(BaseView):
         save_btn.grid(row=0, column=2, sticky="e")
 
         # Scrollable frame for settings
-        canvas_frame = tk.Frame(self, bg="#f0f0f0")
+        canvas_frame = tk.Frame(self, bg=_BG)
         canvas_frame.grid(row=1, column=0, sticky="nsew", padx=20, pady=10)
         canvas_frame.grid_rowconfigure(0, weight=1)
         canvas_frame.grid_columnconfigure(0, weight=1)
 
-        self.canvas = tk.Canvas(canvas_frame, bg="#f0f0f0", highlightthickness=0)
+        self.canvas = tk.Canvas(canvas_frame, bg=_BG, highlightthickness=0)
         scrollbar = tk.Scrollbar(
             canvas_frame, orient="vertical", command=self.canvas.yview
         )
-        self.scrollable_frame = tk.Frame(self.canvas, bg="#f0f0f0")
+        self.scrollable_frame = tk.Frame(self.canvas, bg=_BG)
 
-        self.scrollable_frame.bind(
-            "<Configure>",
-            lambda e: self.canvas.configure(scrollregion=self.canvas.bbox("all")),
-        )
+        self.scrollable_frame.bind("<Configure>", self._mark_scroll_dirty)
 
         self.canvas_window = self.canvas.create_window(
             (0, 0), window=self.scrollable_frame, anchor="nw"
@@ -390,9 +581,6 @@ class SettingsView(BaseView):
         self.canvas.grid(row=0, column=0, sticky="nsew")
         scrollbar.grid(row=0, column=1, sticky="ns")
 
-        # Bind mouse wheel for scrolling
-        self.canvas.bind_all("<MouseWheel>", self._on_mousewheel)
-
         # Bind canvas resize to update scrollable frame width
         self.canvas.bind("<Configure>", self._on_canvas_configure)
 
@@ -403,9 +591,33 @@ class SettingsView(BaseView):
         """Update scrollable frame width when canvas is resized."""
         self.canvas.itemconfig(self.canvas_window, width=event.width)
 
+    def _mark_scroll_dirty(self, event: tk.Event) -> None:
+        """Coalesce configure events into one scrollregion update per idle."""
+        if not self._scroll_dirty:
+            self._scroll_dirty = True
+            self.after_idle(self._recompute_scrollregion)
+
+    def _recompute_scrollregion(self) -> None:
+        """Recompute the canvas scrollregion if the content bbox changed."""
+        self._scroll_dirty = False
+        bbox = self.canvas.bbox("all")
+        if bbox != self._last_bbox:
+            self._last_bbox = bbox
+            self.canvas.configure(scrollregion=bbox)
+
     def _on_mousewheel(self, event: tk.Event) -> None:
-        """Handle mouse wheel scrolling."""
-        self.canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
+        """Handle mouse wheel scrolling (Windows/macOS delta events)."""
+        if not event.delta:
+            return
+        # Windows reports multiples of 120 per notch; macOS reports small
+        # raw values (±1..±10), so scroll at least one unit and keep the
+        # step symmetric in both directions
+        ticks = max(1, abs(event.delta) // 120)
+        self.canvas.yview_scroll(-ticks if event.delta > 0 else ticks, "units")
+
+    def _on_scroll_button(self, event: tk.Event) -> None:
+        """Handle X11 scroll button events (Button-4 up, Button-5 down)."""
+        self.canvas.yview_scroll(-1 if event.num == 4 else 1, "units")
 
     def _build_settings_fields(self) -> None:
         """Build the settings input fields based on config structure."""
@@ -490,10 +702,12 @@ class SettingsView(BaseView):
             ),
         ]
 
-        label_font = tkfont.Font(family="Arial", size=12, weight="bold")
-        desc_font = tkfont.Font(family="Arial", size=10)
-        entry_font = tkfont.Font(family="Arial", size=12)
-        browse_font = tkfont.Font(family="Arial", size=10)
+        label_font = _font("Arial", 12, "bold")
+        desc_font = _font("Arial", 10)
+        entry_font = _font("Arial", 12)
+        browse_font = _font("Arial", 10)
+
+        self.scrollable_frame.grid_columnconfigure(0, weight=1)
 
         for i, (key, field_type, label, description) in enumerate(settings_schema):
             # Container for each setting
@@ -502,7 +716,6 @@ class SettingsView(BaseView):
             )
             row_frame.grid(row=i, column=0, sticky="ew", padx=10, pady=5)
             row_frame.grid_columnconfigure(1, weight=1)
-            self.scrollable_frame.grid_columnconfigure(0, weight=1)
 
             # Label
             lbl = tk.Label(
@@ -644,7 +857,7 @@ class SettingsView(BaseView):
         confirm_label = tk.Label(
             self,
             text="✓ Settings saved!",
-            font=tkfont.Font(family="Arial", size=14, weight="bold"),
+            font=_font("Arial", 14, "bold"),
             bg="#27ae60",
             fg="white",
             padx=20,
@@ -655,6 +868,11 @@ class SettingsView(BaseView):
 
     def show(self) -> None:
         """Refresh settings values when view is shown."""
+        # Only capture the mouse wheel while the settings view is active
+        self.canvas.bind_all("<MouseWheel>", self._on_mousewheel)
+        self.canvas.bind_all("<Button-4>", self._on_scroll_button)
+        self.canvas.bind_all("<Button-5>", self._on_scroll_button)
+
         # Update all entry fields with current config values
         for key, (widget, field_type) in self.entries.items():
             current_value = self.config.get(key, "")
@@ -668,20 +886,276 @@ class SettingsView(BaseView):
 
     def hide(self) -> None:
         """Unbind mousewheel when hiding."""
-        pass
+        self.canvas.unbind_all("<MouseWheel>")
+        self.canvas.unbind_all("<Button-4>")
+        self.canvas.unbind_all("<Button-5>")
 
 
-class CountingGameView(BaseView):
-    """Counting game view where children count images."""
+class GameViewBase(BaseView):
+    """Shared machinery for the game views.
+
+    Owns the progress boxes, the pooled answer buttons and the
+    answer-checking flow. Subclasses build the round content and supply
+    the game-specific hooks: _answer_range, _answer_colors,
+    _record_history and the _results_view name.
+    """
+
+    # Name of the results view shown when the session ends
+    _results_view: str
 
     def __init__(self, parent: tk.Widget, controller: "GameController"):
         super().__init__(parent, controller)
         self.current_round = 0
         self.correct_answer = 0
-        self.history: list[dict] = []  # Track game history
+        # Running score, maintained in _check_answer so the results views
+        # never need to rescan the history
+        self.correct_count = 0
+        self.wrong_count = 0
         self.images: list[ImageTk.PhotoImage] = []  # Keep references
         self.answer_buttons: list[tk.Button] = []
+        # Current round's (button, answer) pairs; avoids cget text parsing
+        self._btn_answers: list[tuple[tk.Button, int]] = []
+        # Private generator; skips the module-level global-state lookups
+        self._rng = random.Random()
+        # Pending round-advance timer; doubles as a "round resolved" flag
+        self._advance_after_id: str | None = None
+        # Pending background decode of the current round's image
+        self._image_future: Future | None = None
         self.available_images: list[Path] = []
+        self._snapshot_config()
+
+    def _snapshot_config(self) -> None:
+        """Snapshot the hot config values onto plain instance attributes.
+
+        The per-round callbacks fire many times per session; reading plain
+        instance attributes there is cheaper than walking the Config
+        property chain on every call, and a single snapshot point also
+        picks up settings changes between sessions.
+        """
+        config = self.config
+        self._rounds = config.game_rounds
+        self._max_number = config.game_max_number
+        self._delay = config.game_delay
+        self._image_size = config.game_image_size
+        self._resample = config.game_resample
+        self._group_gap = config.game_group_gap
+
+    def show(self) -> None:
+        """Start a new game session."""
+        # Drop any advance left over from a session abandoned mid-round
+        if self._advance_after_id is not None:
+            self.after_cancel(self._advance_after_id)
+            self._advance_after_id = None
+        self._snapshot_config()
+        self._load_available_images()
+        self.current_round = 0
+        self.correct_count = 0
+        self.wrong_count = 0
+        self.history = []
+        self._init_progress_boxes()
+        self._next_round()
+
+    def _load_available_images(self) -> None:
+        """Load list of available images from the images folder."""
+        self.available_images = _list_by_ext(self.config.images_folder, _IMAGE_EXTS)
+
+    def _on_image_frame_configure(self, event: tk.Event) -> None:
+        """Remember the image area size for _calculate_image_size."""
+        self._frame_size = (event.width, event.height)
+
+    def hide(self) -> None:
+        """Cancel any pending background decode when leaving the view."""
+        if self._image_future is not None:
+            self._image_future.cancel()
+            self._image_future = None
+
+    def _prepare_image(self, image_path: Path, img_size: int) -> Image.Image:
+        """Decode and resize the round's image (runs on the worker thread).
+
+        The caller resolves img_size on the Tk thread (it may read widget
+        geometry); this method touches only PIL and plain Python state.
+        """
+        # Peek at the source dimensions (header read only) to preserve
+        # the aspect ratio
+        with Image.open(image_path) as src:
+            width, height = src.size
+        if width > height:
+            new_width = img_size
+            new_height = int(height * img_size / width)
+        else:
+            new_height = img_size
+            new_width = int(width * img_size / height)
+
+        return _resized_rgba(
+            str(image_path),
+            image_path.stat().st_mtime_ns,
+            new_width,
+            new_height,
+            self._resample,
+        )
+
+    def _init_progress_boxes(self) -> None:
+        """Initialize the progress boxes."""
+        total_rounds = self._rounds
+
+        # Reuse the rectangle items from the previous session when the
+        # round count is unchanged; just reset them all to gray
+        if len(self.progress_items) == total_rounds:
+            self.progress_canvas.itemconfig("box", fill="#bdc3c7", outline="#95a5a6")
+            return
+
+        # Round count changed: redraw the row on the shared canvas
+        self.progress_canvas.delete("box")
+        self.progress_items.clear()
+
+        box_size = 20
+        pitch = box_size + 4
+        self.progress_canvas.config(width=total_rounds * pitch - 4, height=box_size)
+        for i in range(total_rounds):
+            x = i * pitch
+            item = self.progress_canvas.create_rectangle(
+                x + 2,
+                2,
+                x + box_size - 2,
+                box_size - 2,
+                fill="#bdc3c7",  # Gray
+                outline="#95a5a6",
+                tags="box",
+            )
+            self.progress_items.append(item)
+
+    def _update_progress_box(self, round_num: int, is_correct: bool) -> None:
+        """Update a progress box color based on answer correctness."""
+        if 0 < round_num <= len(self.progress_items):
+            color = "#2ecc71" if is_correct else "#e74c3c"  # Green or Red
+            # The rectangle geometry never changes; recolor it in place
+            # instead of deleting and recreating the canvas item
+            self.progress_canvas.itemconfig(
+                self.progress_items[round_num - 1],
+                fill=color,
+                outline="#27ae60" if is_correct else "#c0392b",
+            )
+
+    def _answer_range(self) -> tuple[int, int]:
+        """Bounds for wrong-answer candidates (inclusive)."""
+        raise NotImplementedError
+
+    def _answer_colors(self) -> tuple[str, str]:
+        """Answer-button (background, active background) colors."""
+        raise NotImplementedError
+
+    def _record_history(self, answer: int, is_correct: bool) -> None:
+        """Append the game-specific history record for this round."""
+        raise NotImplementedError
+
+    def _create_answer_buttons(self) -> None:
+        """Create three answer buttons with one correct answer."""
+        # Generate wrong answers
+        min_val, max_val = self._answer_range()
+
+        # The bounds always leave at least two candidates, so one sample
+        # replaces a rejection loop
+        candidates = [
+            n for n in range(min_val, max_val + 1) if n != self.correct_answer
+        ]
+        wrong_answers = self._rng.sample(candidates, 2)
+
+        # Combine and shuffle
+        answers = [self.correct_answer] + wrong_answers
+        self._rng.shuffle(answers)
+
+        bg_color, active_color = self._answer_colors()
+
+        # Create the button pool once; afterwards the same three buttons are
+        # reconfigured and re-shown every round
+        if not self.answer_buttons:
+            button_font = _font("Arial", 36, "bold")
+            for _ in range(3):
+                btn = tk.Button(
+                    self.answer_frame,
+                    font=button_font,
+                    width=4,
+                    height=1,
+                    fg="white",
+                    activebackground=active_color,
+                    activeforeground="white",
+                    relief="flat",
+                )
+                self.answer_buttons.append(btn)
+
+        self._btn_answers = list(zip(self.answer_buttons, answers))
+        for btn, answer in self._btn_answers:
+            btn.config(
+                text=str(answer),
+                bg=bg_color,
+                state="normal",
+                cursor="hand2",
+                command=partial(self._check_answer, answer),
+            )
+            btn.pack(side="left", padx=20)
+
+    def _check_answer(self, answer: int) -> None:
+        """Check if the selected answer is correct."""
+        # Ignore clicks that slip in after the round is already resolved
+        if self._advance_after_id is not None:
+            return
+
+        is_correct = answer == self.correct_answer
+        if is_correct:
+            self.correct_count += 1
+        else:
+            self.wrong_count += 1
+
+        # Record history
+        self._record_history(answer, is_correct)
+
+        # Update progress box
+        self._update_progress_box(self.current_round, is_correct)
+
+        # Disable and highlight each button in a single pass, using the
+        # recorded (button, answer) pairs instead of parsing cget("text")
+        for btn, btn_answer in self._btn_answers:
+            if btn_answer == self.correct_answer:
+                btn.config(state="disabled", cursor="", bg="#2ecc71")  # Green
+            elif btn_answer == answer and not is_correct:
+                btn.config(state="disabled", cursor="", bg="#e74c3c")  # Red
+            else:
+                btn.config(state="disabled", cursor="")
+
+        # Play sound only for correct answers (positive reinforcement)
+        if is_correct:
+            self.controller.sound_player.play_random_from_folder(
+                self.config.correct_sound_folder
+            )
+
+        # Schedule the round advance; the guard at the top of this method
+        # ensures no other advance is pending
+        self._advance_after_id = self.after(self._delay, self._advance_round)
+
+    def _advance_round(self) -> None:
+        """Timer target for the round advance; clears the pending id."""
+        self._advance_after_id = None
+        self._next_round()
+
+    def _show_results(self) -> None:
+        """Show the results screen."""
+        self.controller.show_view(
+            self._results_view,
+            history=self.history,
+            correct_count=self.correct_count,
+            wrong_count=self.wrong_count,
+        )
+
+
+class CountingGameView(GameViewBase):
+    """Counting game view where children count images."""
+
+    _results_view = "counting_results"
+
+    def __init__(self, parent: tk.Widget, controller: "GameController"):
+        super().__init__(parent, controller)
+        # History records: (correct_answer, player_answer, is_correct)
+        self.history: list[tuple[int, int, bool]] = []
         self._setup_ui()
 
     def _setup_ui(self) -> None:
@@ -692,11 +1166,11 @@ class CountingGameView(BaseView):
         self.grid_rowconfigure(2, weight=0)  # Answer area (fixed height)
 
         # Header with back button and round info
-        header = tk.Frame(self, bg="#f0f0f0")
+        header = tk.Frame(self, bg=_BG)
         header.grid(row=0, column=0, sticky="ew", padx=20, pady=10)
         header.grid_columnconfigure(1, weight=1)
 
-        back_font = tkfont.Font(family="Arial", size=14)
+        back_font = _font("Arial", 14)
         self.back_btn = tk.Button(
             header,
             text="⬅️",
@@ -705,121 +1179,137 @@ class CountingGameView(BaseView):
             fg="white",
             relief="flat",
             cursor="hand2",
-            command=lambda: self.controller.show_view("main_menu"),
+            command=partial(self.controller.show_view, "main_menu"),
         )
         self.back_btn.grid(row=0, column=0, sticky="w")
 
         # Progress boxes frame
-        self.progress_frame = tk.Frame(header, bg="#f0f0f0")
-        self.progress_frame.grid(row=0, column=1)
-        self.progress_boxes: list[tk.Canvas] = []
+        # One canvas for the whole progress row; the boxes are rectangle
+        # items recolored in place
+        self.progress_canvas = tk.Canvas(
+            header, height=20, bg=_BG, highlightthickness=0
+        )
+        self.progress_canvas.grid(row=0, column=1)
+        self.progress_items: list[int] = []
 
         # Image display area
-        self.image_frame = tk.Frame(self, bg="#ecf0f1")
+        self.image_frame = tk.Frame(self, bg=_BOARD_BG)
         self.image_frame.grid(row=1, column=0, sticky="nsew", padx=20, pady=10)
         self.image_frame.grid_rowconfigure(0, weight=1)
         self.image_frame.grid_columnconfigure(0, weight=1)
 
-        # Answer buttons area (centered)
-        self.answer_frame = tk.Frame(self, bg="#f0f0f0")
-        self.answer_frame.grid(row=2, column=0, pady=(10, 30))
-
-    def _load_available_images(self) -> None:
-        """Load list of available images from the images folder."""
-        images_folder = self.config.images_folder
-        self.available_images = []
-
-        if images_folder.exists():
-            for ext in ["*.png", "*.jpg", "*.jpeg", "*.gif", "*.bmp"]:
-                self.available_images.extend(images_folder.glob(ext))
+        # Track the image area size from resize events so the per-round size
+        # calculation never needs to force a layout pass
+        self._frame_size: tuple[int, int] | None = None
+        self.image_frame.bind("<Configure>", self._on_image_frame_configure)
 
-    def show(self) -> None:
-        """Start a new counting game."""
-        self._load_available_images()
-        self.current_round = 0
-        self.history = []
-        self._init_progress_boxes()
-        self._next_round()
+        # Persistent canvas for the image grid: image items are created on
+        # demand, then re-pointed/hidden between rounds — no widget churn
+        self._image_canvas = tk.Canvas(
+            self.image_frame, bg=_BOARD_BG, highlightthickness=0
+        )
+        self._image_canvas.grid(row=0, column=0)  # Centered via grid config
+        self._image_canvas.grid_remove()
+        self._image_items: list[int] = []
+        self._fallback_canvas: tk.Canvas | None = None
 
-    def _init_progress_boxes(self) -> None:
-        """Initialize the progress boxes."""
-        # Clear existing boxes
-        for box in self.progress_boxes:
-            box.destroy()
-        self.progress_boxes.clear()
+        # Answer buttons area (centered)
+        self.answer_frame = tk.Frame(self, bg=_BG)
+        self.answer_frame.grid(row=2, column=0, pady=(10, 30))
 
-        # Create new boxes
-        total_rounds = self.config.game_rounds
-        box_size = 20
-        for i in range(total_rounds):
-            box = tk.Canvas(
-                self.progress_frame,
-                width=box_size,
-                height=box_size,
-                bg="#f0f0f0",
-                highlightthickness=0,
+    def _ensure_image_items(self, count: int) -> None:
+        """Grow the canvas image-item pool to at least count items."""
+        while len(self._image_items) < count:
+            self._image_items.append(
+                self._image_canvas.create_image(0, 0, state="hidden")
             )
-            box.create_rectangle(
-                2,
-                2,
-                box_size - 2,
-                box_size - 2,
-                fill="#bdc3c7",  # Gray
-                outline="#95a5a6",
-                tags="box",
-            )
-            box.grid(row=0, column=i, padx=2)
-            self.progress_boxes.append(box)
 
-    def _update_progress_box(self, round_num: int, is_correct: bool) -> None:
-        """Update a progress box color based on answer correctness."""
-        if 0 < round_num <= len(self.progress_boxes):
-            box = self.progress_boxes[round_num - 1]
-            color = "#2ecc71" if is_correct else "#e74c3c"  # Green or Red
-            box.delete("box")
-            box_size = 20
-            box.create_rectangle(
-                2,
-                2,
-                box_size - 2,
-                box_size - 2,
-                fill=color,
-                outline="#27ae60" if is_correct else "#c0392b",
-                tags="box",
-            )
+    def _hide_image_pool(self) -> None:
+        """Hide the image canvas and its items without destroying anything."""
+        for item in self._image_items:
+            self._image_canvas.itemconfig(item, state="hidden")
+        self._image_canvas.grid_remove()
+
+    def _render_image_grid(
+        self, groups: tuple[int, ...], photo: ImageTk.PhotoImage
+    ) -> None:
+        """Point the pooled canvas items at one photo in the given grouping."""
+        gap = self._group_gap
+        width, height = photo.width(), photo.height()
+        cell = width + 4  # Image plus 2px padding on each side
+        row_pitch = height + 10
+
+        def row_width(group_size: int) -> int:
+            # Groups of 10 get extra spacing after the 5th image
+            return group_size * cell + (gap - 2 if group_size == 10 else 0)
+
+        total_w = max((row_width(g) for g in groups), default=cell)
+        total_h = max(len(groups), 1) * row_pitch
+
+        self._ensure_image_items(sum(groups))
+        canvas = self._image_canvas
+        canvas.config(width=total_w, height=total_h)
+        canvas.grid()
+
+        idx = 0
+        for row_idx, group_size in enumerate(groups):
+            x = (total_w - row_width(group_size)) // 2 + 2
+            y = row_idx * row_pitch + row_pitch // 2
+            for col_idx in range(group_size):
+                item = self._image_items[idx]
+                canvas.coords(item, x + width // 2, y)
+                canvas.itemconfig(item, image=photo, state="normal")
+                x += cell
+                # Extra spacing after the 5th image in groups of 10
+                if group_size == 10 and col_idx == 4:
+                    x += gap - 2
+                idx += 1
+
+        for item in self._image_items[idx:]:
+            canvas.itemconfig(item, state="hidden")
 
     def _next_round(self) -> None:
         """Set up the next round."""
         self.current_round += 1
-        total_rounds = self.config.game_rounds
+        total_rounds = self._rounds
 
         if self.current_round > total_rounds:
             self._show_results()
             return
 
-        # Clear previous images
-        for widget in self.image_frame.winfo_children():
-            widget.destroy()
+        # Hide pooled image items and drop any transient fallback shapes
+        self._hide_image_pool()
+        if self._fallback_canvas is not None:
+            self._fallback_canvas.destroy()
+            self._fallback_canvas = None
         self.images.clear()
 
-        # Clear previous answer buttons
-        for widget in self.answer_frame.winfo_children():
-            widget.destroy()
-        self.answer_buttons.clear()
+        # Hide the pooled answer buttons (they are reconfigured next round)
+        for btn in self.answer_buttons:
+            btn.pack_forget()
 
         # Generate random count
         min_count = 1
-        max_count = self.config.game_max_number
-        self.correct_answer = random.randint(min_count, max_count)
+        max_count = self._max_number
+        self.correct_answer = self._rng.randint(min_count, max_count)
 
-        # Store image path for delayed display
+        # Store image path for delayed display; decoding and resizing start
+        # in the background so the work overlaps with the game delay
         if self.available_images:
-            self._current_image_path = random.choice(self.available_images)
+            self._current_image_path = self._rng.choice(self.available_images)
+            # The target size reads widget geometry, so resolve it here on
+            # the Tk thread and hand the worker plain numbers
+            count = self.correct_answer
+            img_size = self._calculate_image_size(count, self._calculate_groups(count))
+            self._image_future = _decode_executor.submit(
+                self._prepare_image, self._current_image_path, img_size
+            )
         else:
             self._current_image_path = None
+            self._image_future = None
 
         # Show images after delay, then answers after another delay
-        delay = self.config.game_delay
+        delay = self._delay
         self.after(delay, self._show_images)
 
     def _show_images(self) -> None:
@@ -830,15 +1320,19 @@ class CountingGameView(BaseView):
             self._display_fallback_shapes(self.correct_answer)
 
         # Show answer buttons after another delay
-        delay = self.config.game_delay
+        delay = self._delay
         self.after(delay, self._create_answer_buttons)
 
-    def _calculate_groups(self, count: int) -> list[int]:
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def _calculate_groups(count: int) -> tuple[int, ...]:
         """Calculate groups for displaying images.
 
         Groups help children understand number composition:
         - Even numbers: groups of 10, 4, 2
         - Odd numbers: after 10s, use 3+2 patterns (e.g., 5=3+2, 7=4+3, 9=4+3+2)
+
+        Pure function of count, so results are memoized.
         """
         groups = []
         remaining = count
@@ -876,94 +1370,51 @@ class CountingGameView(BaseView):
                 groups.append(3)
                 groups.append(2)
 
-        return groups
+        return tuple(groups)
 
-    def _calculate_image_size(self, count: int, groups: list[int]) -> int:
+    def _calculate_image_size(self, count: int, groups: tuple[int, ...]) -> int:
         """Calculate appropriate image size based on count and available space."""
-        base_size = self.config.game_image_size
-
-        # Get available frame dimensions
-        self.image_frame.update_idletasks()
-        frame_height = self.image_frame.winfo_height()
-        frame_width = self.image_frame.winfo_width()
-
-        if frame_height < 50:  # Frame not yet sized
-            frame_height = 400
-        if frame_width < 50:
-            frame_width = 800
-
-        num_rows = len(groups) if groups else 1
-        max_cols = max(groups) if groups else count
-
-        # Calculate max size that fits vertically (with padding)
-        vertical_padding = 10 * (num_rows + 1)  # pady between rows
-        max_height_per_image = (
-            (frame_height - vertical_padding) // num_rows if num_rows > 0 else base_size
-        )
+        # Use the size cached from <Configure> events; no forced layout pass
+        if self._frame_size is not None:
+            frame_width, frame_height = self._frame_size
+        else:
+            frame_width = self.image_frame.winfo_width()
+            frame_height = self.image_frame.winfo_height()
 
-        # Calculate max size that fits horizontally (with padding)
-        horizontal_padding = 6 * (max_cols + 1)  # padx between columns
-        max_width_per_image = (
-            (frame_width - horizontal_padding) // max_cols
-            if max_cols > 0
-            else base_size
+        return _grid_image_size(
+            groups, count, frame_width, frame_height, self._image_size
         )
 
-        # Use the smaller of the two to ensure it fits
-        calculated_size = min(max_height_per_image, max_width_per_image, base_size)
-
-        # Ensure minimum size
-        return max(30, int(calculated_size * 0.9))  # 90% to leave some margin
-
     def _display_images(self, image_path: Path, count: int) -> None:
         """Display the specified image multiple times in educational groups."""
-        try:
-            # Calculate groups for educational display
-            groups = self._calculate_groups(count)
-
-            # Calculate appropriate image size
-            img_size = self._calculate_image_size(count, groups)
-
-            # Load image and resize preserving aspect ratio
-            img = Image.open(image_path)
+        # Calculate groups for educational display
+        groups = self._calculate_groups(count)
 
-            # Calculate new size preserving aspect ratio
-            width, height = img.size
-            if width > height:
-                new_width = img_size
-                new_height = int(height * img_size / width)
+        # Only the decode can reasonably fail; widget creation happens
+        # after the image is safely in hand, so a bad file can no longer
+        # leave a half-built round behind
+        try:
+            # By now the background worker has usually finished; result()
+            # just hands the decoded image over
+            if self._image_future is not None:
+                img = self._image_future.result()
             else:
-                new_height = img_size
-                new_width = int(width * img_size / height)
-
-            img = img.resize((new_width, new_height), Image.Resampling.LANCZOS)
-
-            # Create a frame to hold images, centered in image_frame
-            inner_frame = tk.Frame(self.image_frame, bg="#ecf0f1")
-            inner_frame.grid(row=0, column=0)  # Centered via grid config
-
-            # Display images in groups (each group in a row)
-            row_idx = 0
-            for group_size in groups:
-                # Create a frame for this group/row
-                row_frame = tk.Frame(inner_frame, bg="#ecf0f1")
-                row_frame.grid(row=row_idx, column=0, pady=3)
-
-                for col_idx in range(group_size):
-                    photo = ImageTk.PhotoImage(img)
-                    self.images.append(photo)  # Keep reference
-
-                    label = tk.Label(row_frame, image=photo, bg="#ecf0f1")
-                    # Add extra padding after 5th image in groups of 10
-                    gap = self.config.game_group_gap
-                    padx_right = gap if (group_size == 10 and col_idx == 4) else 2
-                    label.grid(row=0, column=col_idx, padx=(2, padx_right), pady=2)
-
-                row_idx += 1
-
+                img = self._prepare_image(
+                    image_path, self._calculate_image_size(count, groups)
+                )
         except Exception as e:
             print(f"Error loading image: {e}")
             self._display_fallback_shapes(count)
+            return
+
+        # One PhotoImage is shared by every label in the round; Tk only
+        # needs a single live reference to keep the image alive.
+        # PhotoImage creation itself must happen on the Tk thread.
+        photo = ImageTk.PhotoImage(img)
+        self.images.append(photo)
+
+        # Display images in groups via the persistent widget pool
+        self._render_image_grid(groups, photo)
 
     def _display_fallback_shapes(self, count: int) -> None:
         """Display colored circles as fallback when no images available."""
@@ -971,117 +1422,66 @@ class CountingGameView(BaseView):
         groups = self._calculate_groups(count)
         img_size = self._calculate_image_size(count, groups)
 
-        inner_frame = tk.Frame(self.image_frame, bg="#ecf0f1")
-        inner_frame.grid(row=0, column=0)  # Centered via grid config
+        # Fallback shapes are transient; _next_round destroys this canvas.
+        # All shapes are drawn as items on ONE canvas: item creation is a
+        # cheap display-list entry, versus one Tcl widget + grid slot each.
+        self._hide_image_pool()
 
-        colors = ["#e74c3c", "#3498db", "#2ecc71", "#f39c12", "#9b59b6"]
-        color_idx = 0
+        gap = self._group_gap
+        cell = img_size + 4  # Shape plus 2px padding on each side
+        row_pitch = img_size + 10
+
+        def row_width(group_size: int) -> int:
+            # Groups of 10 get extra spacing after the 5th shape
+            return group_size * cell + (gap - 2 if group_size == 10 else 0)
 
-        # Display shapes in groups (each group in a row)
-        row_idx = 0
-        for group_size in groups:
-            row_frame = tk.Frame(inner_frame, bg="#ecf0f1")
-            row_frame.grid(row=row_idx, column=0, pady=3)
+        total_w = max((row_width(g) for g in groups), default=cell)
+        total_h = max(len(groups), 1) * row_pitch
 
+        canvas = tk.Canvas(
+            self.image_frame,
+            width=total_w,
+            height=total_h,
+            bg=_BOARD_BG,
+            highlightthickness=0,
+        )
+        canvas.grid(row=0, column=0)  # Centered via grid config
+        self._fallback_canvas = canvas
+
+        colors = _COLORS
+        color_idx = 0
+
+        # Draw shapes in groups (each group in a row, centered)
+        for row_idx, group_size in enumerate(groups):
+            x = (total_w - row_width(group_size)) // 2
+            y = row_idx * row_pitch + 5
             for col_idx in range(group_size):
-                canvas = tk.Canvas(
-                    row_frame,
-                    width=img_size,
-                    height=img_size,
-                    bg="#ecf0f1",
-                    highlightthickness=0,
-                )
                 color = colors[color_idx % len(colors)]
                 canvas.create_oval(
-                    5, 5, img_size - 5, img_size - 5, fill=color, outline=""
+                    x + 7,
+                    y + 5,
+                    x + img_size - 3,
+                    y + img_size - 5,
+                    fill=color,
+                    outline="",
                 )
-                # Add extra padding after 5th shape in groups of 10
-                gap = self.config.game_group_gap
-                padx_right = gap if (group_size == 10 and col_idx == 4) else 2
-                canvas.grid(row=0, column=col_idx, padx=(2, padx_right), pady=2)
+                x += cell
+                # Extra spacing after the 5th shape in groups of 10
+                if group_size == 10 and col_idx == 4:
+                    x += gap - 2
                 color_idx += 1
 
-            row_idx += 1
-
-    def _create_answer_buttons(self) -> None:
-        """Create three answer buttons with one correct answer."""
-        # Generate wrong answers
-        min_val = max(1, self.correct_answer - 3)
-        max_val = self.correct_answer + 3
-
-        wrong_answers = []
-        while len(wrong_answers) < 2:
-            num = random.randint(min_val, max_val)
-            if num != self.correct_answer and num not in wrong_answers and num >= 1:
-                wrong_answers.append(num)
-
-        # Combine and shuffle
-        answers = [self.correct_answer] + wrong_answers
-        random.shuffle(answers)
-
-        # Create buttons
-        button_font = tkfont.Font(family="Arial", size=36, weight="bold")
-
-        for answer in answers:
-            btn = tk.Button(
-                self.answer_frame,
-                text=str(answer),
-                font=button_font,
-                width=4,
-                height=1,
-                bg="#3498db",
-                fg="white",
-                activebackground="#2980b9",
-                activeforeground="white",
-                relief="flat",
-                cursor="hand2",
-                command=lambda a=answer: self._check_answer(a),
-            )
-            btn.pack(side="left", padx=20)
-            self.answer_buttons.append(btn)
-
-    def _check_answer(self, answer: int) -> None:
-        """Check if the selected answer is correct."""
-        is_correct = answer == self.correct_answer
-
-        # Record history
-        self.history.append(
-            {
-                "round": self.current_round,
-                "correct_answer": self.correct_answer,
-                "player_answer": answer,
-                "is_correct": is_correct,
-            }
-        )
+    def _answer_range(self) -> tuple[int, int]:
+        """Bounds for wrong-answer candidates (inclusive)."""
+        return max(1, self.correct_answer - 3), self.correct_answer + 3
 
-        # Update progress box
-        self._update_progress_box(self.current_round, is_correct)
+    def _answer_colors(self) -> tuple[str, str]:
+        """Answer-button (background, active background) colors."""
+        return "#3498db", "#2980b9"
 
-        # Disable all buttons
-        for btn in self.answer_buttons:
-            btn.config(state="disabled", cursor="")
-
-        # Highlight buttons
-        for btn in self.answer_buttons:
-            btn_answer = int(btn.cget("text"))
-            if btn_answer == self.correct_answer:
-                btn.config(bg="#2ecc71")  # Green for correct
-            elif btn_answer == answer and not is_correct:
-                btn.config(bg="#e74c3c")  # Red for wrong selection
-
-        # Play sound only for correct answers (positive reinforcement)
-        if is_correct:
-            self.controller.sound_player.play_random_from_folder(
-                self.config.correct_sound_folder
-            )
-
-        # Schedule next round
-        delay = self.config.game_delay
-        self.after(delay, self._next_round)
-
-    def _show_results(self) -> None:
-        """Show the results screen."""
-        self.controller.show_view("counting_results", history=self.history)
+    def _record_history(self, answer: int, is_correct: bool) -> None:
+        """Append the (correct, player, is_correct) record."""
+        self.history.append((self.correct_answer, answer, is_correct))
 
 
 class CountingResultsView(BaseView):
@@ -1089,7 +1489,10 @@ class CountingResultsView(BaseView):
 
     def __init__(self, parent: tk.Widget, controller: "GameController"):
         super().__init__(parent, controller)
-        self.history: list[dict] = []
+        # History records: (correct_answer, player_answer, is_correct)
+        self.history: list[tuple[int, int, bool]] = []
+        self._correct_count = 0
+        self._wrong_count = 0
         self.video_player: VideoPlayer | None = None
         self._setup_ui()
 
@@ -1101,78 +1504,68 @@ class CountingResultsView(BaseView):
         self.grid_rowconfigure(2, weight=0)
 
         # Title
-        title_font = tkfont.Font(family="Arial", size=48, weight="bold")
+        title_font = _font("Arial", 48, "bold")
         self.title_label = tk.Label(
-            self, text="🏆", font=title_font, bg="#f0f0f0", fg="#2c3e50"
+            self, text="🏆", font=title_font, bg=_BG, fg="#2c3e50"
         )
         self.title_label.grid(row=0, column=0, columnspan=2, pady=(30, 20))
 
         # Main content area (will hold results on left, video on right)
-        self.content_frame = tk.Frame(self, bg="#f0f0f0")
+        self.content_frame = tk.Frame(self, bg=_BG)
         self.content_frame.grid(row=1, column=0, sticky="nsew", padx=20)
         self.content_frame.grid_columnconfigure(0, weight=1)
         self.content_frame.grid_columnconfigure(1, weight=1)
         self.content_frame.grid_rowconfigure(0, weight=1)
 
         # Results area (left side)
-        self.results_frame = tk.Frame(self.content_frame, bg="#f0f0f0")
+        self.results_frame = tk.Frame(self.content_frame, bg=_BG)
         self.results_frame.grid(row=0, column=0, sticky="nsew", padx=10)
 
         # Video area (right side) - will be populated when needed
-        self.video_container = tk.Frame(self.content_frame, bg="#f0f0f0")
+        self.video_container = tk.Frame(self.content_frame, bg=_BG)
         self.video_container.grid(row=0, column=1, sticky="nsew", padx=10)
 
-        # Button area
-        self.button_frame = tk.Frame(self, bg="#f0f0f0")
-        self.button_frame.grid(row=2, column=0, pady=30)
+        # Persistent score label and history grid; history entries are
+        # pooled and reconfigured on every show instead of rebuilt
+        self._score_label = tk.Label(
+            self.results_frame, font=_font("Arial", 32, "bold"), bg=_BG, fg="#2ecc71"
+        )
+        self._score_label.pack(pady=(0, 30))
+        self._history_frame = tk.Frame(self.results_frame, bg=_BG)
+        self._history_frame.pack()
+        # Pooled entries: (cell frame, answer label, wrong-answer label)
+        self._entry_pool: list[tuple[tk.Frame, tk.Label, tk.Label]] = []
 
-        button_font = tkfont.Font(family="Arial", size=20, weight="bold")
-        button_config = {
-            "font": button_font,
-            "width": 15,
-            "height": 2,
-            "relief": "flat",
-            "cursor": "hand2",
-        }
+        # Transient video container rebuilt on every show; destroying it
+        # tears down all its children in a single Tcl call
+        self._video_inner: tk.Frame | None = None
 
-        # Play again button
-        self.play_again_btn = tk.Button(
-            self.button_frame,
-            text="🔄",
-            bg="#2ecc71",
-            fg="white",
-            activebackground="#27ae60",
-            activeforeground="white",
-            command=self._on_play_again,
-            **button_config,
-        )
-        self.play_again_btn.pack(side="left", padx=20)
+        # Button area
+        self.button_frame = tk.Frame(self, bg=_BG)
+        self.button_frame.grid(row=2, column=0, pady=30)
 
-        # Main menu button
-        self.menu_btn = tk.Button(
-            self.button_frame,
-            text="🏠",
-            bg="#3498db",
-            fg="white",
-            activebackground="#2980b9",
-            activeforeground="white",
-            command=self._on_main_menu,
-            **button_config,
-        )
-        self.menu_btn.pack(side="left", padx=20)
+        button_font = _font("Arial", 20, "bold")
+        button_config = {**_BUTTON_BASE, "font": button_font}
 
-        # Exit button
-        self.exit_btn = tk.Button(
-            self.button_frame,
-            text="🚪",
-            bg="#e67e22",
-            fg="white",
-            activebackground="#d35400",
-            activeforeground="white",
-            command=self._on_exit,
-            **button_config,
+        # Play again / main menu / exit, built from one spec list
+        button_specs = [
+            ("🔄", "#2ecc71", "#27ae60", self._on_play_again),
+            ("🏠", "#3498db", "#2980b9", self._on_main_menu),
+            ("🚪", "#e67e22", "#d35400", self._on_exit),
+        ]
+        self.play_again_btn, self.menu_btn, self.exit_btn = (
+            tk.Button(
+                self.button_frame,
+                text=text,
+                bg=bg,
+                activebackground=active_bg,
+                command=command,
+                **button_config,
+            )
+            for text, bg, active_bg, command in button_specs
         )
-        self.exit_btn.pack(side="left", padx=20)
+        for btn in (self.play_again_btn, self.menu_btn, self.exit_btn):
+            btn.pack(side="left", padx=20)
 
     def _on_play_again(self) -> None:
         """Handle play again button."""
@@ -1196,15 +1589,19 @@ class CountingResultsView(BaseView):
 
     def _check_video_reward(self) -> bool:
         """Check if player qualifies for video reward."""
-        total = len(self.history)
-        wrong_count = sum(1 for h in self.history if not h["is_correct"])
-
+        # Counts were tallied once in show(); no second history scan
+        total = self._correct_count + self._wrong_count
         min_rounds = self.config.video_min_rounds
         max_wrong = self.config.video_max_wrong
 
-        return total >= min_rounds and wrong_count <= max_wrong
+        return total >= min_rounds and self._wrong_count <= max_wrong
 
-    def show(self, history: list[dict] | None = None) -> None:
+    def show(
+        self,
+        history: list[tuple[int, int, bool]] | None = None,
+        correct_count: int | None = None,
+        wrong_count: int | None = None,
+    ) -> None:
         """Display the results."""
         if history is not None:
             self.history = history
@@ -1212,71 +1609,61 @@ class CountingResultsView(BaseView):
         # Stop any previously playing video
         self._stop_video()
 
-        # Clear previous results
-        for widget in self.results_frame.winfo_children():
-            widget.destroy()
-        for widget in self.video_container.winfo_children():
-            widget.destroy()
-
-        # Calculate score
-        correct_count = sum(1 for h in self.history if h["is_correct"])
-        total = len(self.history)
+        # Clear the previous video by replacing its container wholesale
+        if self._video_inner is not None:
+            self._video_inner.destroy()
+        self._video_inner = tk.Frame(self.video_container, bg=_BG)
+        self._video_inner.pack(fill="both", expand=True)
+
+        # Use the counters the game view maintained round by round; fall
+        # back to one history scan when shown without them
+        if correct_count is None:
+            correct_count = sum(1 for rec in self.history if rec[-1])
+        if wrong_count is None:
+            wrong_count = len(self.history) - correct_count
+        total = correct_count + wrong_count
+        self._correct_count = correct_count
+        self._wrong_count = wrong_count
 
         # Score label
-        score_font = tkfont.Font(family="Arial", size=32, weight="bold")
-        score_text = f"✅ {correct_count} / {total}"
-        score_label = tk.Label(
-            self.results_frame,
-            text=score_text,
-            font=score_font,
-            bg="#f0f0f0",
-            fg="#2ecc71",
-        )
-        score_label.pack(pady=(0, 30))
-
-        # History display
-        history_frame = tk.Frame(self.results_frame, bg="#f0f0f0")
-        history_frame.pack()
-
-        result_font = tkfont.Font(family="Arial", size=28, weight="bold")
-
-        for idx, entry in enumerate(self.history):
-            color = "#2ecc71" if entry["is_correct"] else "#e74c3c"
-
-            frame = tk.Frame(history_frame, bg=color, padx=15, pady=10)
-            row = idx // 5
-            col = idx % 5
-            frame.grid(row=row, column=col, padx=10, pady=10)
-
-            # Show the correct answer
-            label = tk.Label(
-                frame,
-                text=str(entry["correct_answer"]),
-                font=result_font,
-                bg=color,
-                fg="white",
-            )
-            label.pack()
-
-            # Show player's answer if wrong
-            if not entry["is_correct"]:
-                small_font = tkfont.Font(family="Arial", size=12)
-                wrong_label = tk.Label(
-                    frame,
-                    text=f"({entry['player_answer']})",
-                    font=small_font,
-                    bg=color,
-                    fg="white",
-                )
+        self._score_label.config(text=f"✅ {correct_count} / {total}")
+
+        # History display: recycle pooled entry widgets, growing the pool as
+        # needed and hiding any surplus from a longer previous session
+        result_font = _font("Arial", 28, "bold")
+        small_font = _font("Arial", 12)
+
+        for idx, (correct_answer, player_answer, ok) in enumerate(self.history):
+            if idx == len(self._entry_pool):
+                frame = tk.Frame(self._history_frame, padx=15, pady=10)
+                label = tk.Label(frame, font=result_font, fg="white")
+                label.pack()
+                wrong_label = tk.Label(frame, font=small_font, fg="white")
+                self._entry_pool.append((frame, label, wrong_label))
+            frame, label, wrong_label = self._entry_pool[idx]
+
+            color = "#2ecc71" if ok else "#e74c3c"
+            frame.config(bg=color)
+            frame.grid(row=idx // 5, column=idx % 5, padx=10, pady=10)
+
+            # Show the correct answer, plus the player's answer if wrong
+            label.config(text=str(correct_answer), bg=color)
+            if ok:
+                wrong_label.pack_forget()
+            else:
+                wrong_label.config(text=f"({player_answer})", bg=color)
                 wrong_label.pack()
 
+        for frame, _, _ in self._entry_pool[len(self.history) :]:
+            frame.grid_remove()
+
         # Check for video reward
         if self._check_video_reward():
             self._play_video_reward()
 
     def _play_video_reward(self) -> None:
         """Play a video reward if available."""
-        self.video_player = VideoPlayer(self.video_container, self.config)
+        self.video_player = VideoPlayer(self._video_inner, self.config)
 
         if not self.video_player.is_available():
             return
@@ -1286,26 +1673,31 @@ class CountingResultsView(BaseView):
             return
 
         # Create video frame
-        video_frame = self.video_player.create_frame(self.video_container)
+        video_frame = self.video_player.create_frame(self._video_inner)
         video_frame.pack(fill="both", expand=True, pady=20)
 
-        # Start playback after a short delay to ensure frame is ready
-        self.after(100, lambda: self.video_player.play(video_path))
+        def _start_playback(event: tk.Event) -> None:
+            # Once only: the frame can be mapped again when the window is
+            # restored, and the video must not restart then
+            video_frame.unbind("<Map>")
+            self.video_player.play(video_path)
 
+        # Start playback the moment the frame is realized on screen instead
+        # of guessing with a fixed delay
+        video_frame.bind("<Map>", _start_playback)
 
-class AdditionGameView(BaseView):
+
+class AdditionGameView(GameViewBase):
     """Addition game view where children learn to add numbers."""
 
+    _results_view = "addition_results"
+
     def __init__(self, parent: tk.Widget, controller: "GameController"):
         super().__init__(parent, controller)
-        self.current_round = 0
         self.num1 = 0
         self.num2 = 0
-        self.correct_answer = 0
-        self.history: list[dict] = []
-        self.images: list[ImageTk.PhotoImage] = []
-        self.answer_buttons: list[tk.Button] = []
-        self.available_images: list[Path] = []
+        # History records: (num1, num2, correct_answer, player_answer, is_correct)
+        self.history: list[tuple[int, int, int, int, bool]] = []
         self._setup_ui()
 
     def _setup_ui(self) -> None:
@@ -1316,11 +1708,11 @@ class AdditionGameView(BaseView):
         self.grid_rowconfigure(2, weight=0)  # Answer area (fixed height)
 
         # Header with back button and round info
-        header = tk.Frame(self, bg="#f0f0f0")
+        header = tk.Frame(self, bg=_BG)
         header.grid(row=0, column=0, sticky="ew", padx=20, pady=10)
         header.grid_columnconfigure(1, weight=1)
 
-        back_font = tkfont.Font(family="Arial", size=14)
+        back_font = _font("Arial", 14)
         self.back_btn = tk.Button(
             header,
             text="⬅️",
@@ -1329,122 +1721,116 @@ class AdditionGameView(BaseView):
             fg="white",
             relief="flat",
             cursor="hand2",
-            command=lambda: self.controller.show_view("main_menu"),
+            command=partial(self.controller.show_view, "main_menu"),
         )
         self.back_btn.grid(row=0, column=0, sticky="w")
 
         # Progress boxes frame
-        self.progress_frame = tk.Frame(header, bg="#f0f0f0")
-        self.progress_frame.grid(row=0, column=1)
-        self.progress_boxes: list[tk.Canvas] = []
+        # One canvas for the whole progress row; the boxes are rectangle
+        # items recolored in place
+        self.progress_canvas = tk.Canvas(
+            header, height=20, bg=_BG, highlightthickness=0
+        )
+        self.progress_canvas.grid(row=0, column=1)
+        self.progress_items: list[int] = []
 
         # Image display area
-        self.image_frame = tk.Frame(self, bg="#ecf0f1")
+        self.image_frame = tk.Frame(self, bg=_BOARD_BG)
         self.image_frame.grid(row=1, column=0, sticky="nsew", padx=20, pady=10)
         self.image_frame.grid_rowconfigure(0, weight=1)
         self.image_frame.grid_columnconfigure(0, weight=1)
 
-        # Answer buttons area (centered)
-        self.answer_frame = tk.Frame(self, bg="#f0f0f0")
-        self.answer_frame.grid(row=2, column=0, pady=(10, 30))
-
-    def _load_available_images(self) -> None:
-        """Load list of available images from the images folder."""
-        images_folder = self.config.images_folder
-        self.available_images = []
-
-        if images_folder.exists():
-            for ext in ["*.png", "*.jpg", "*.jpeg", "*.gif", "*.bmp"]:
-                self.available_images.extend(images_folder.glob(ext))
-
-    def show(self) -> None:
-        """Start a new addition game."""
-        self._load_available_images()
-        self.current_round = 0
-        self.history = []
-        self._init_progress_boxes()
-        self._next_round()
-
-    def _init_progress_boxes(self) -> None:
-        """Initialize the progress boxes."""
-        # Clear existing boxes
-        for box in self.progress_boxes:
-            box.destroy()
-        self.progress_boxes.clear()
+        # Track the image area size from resize events so the per-round size
+        # calculation never needs to force a layout pass
+        self._frame_size: tuple[int, int] | None = None
+        self.image_frame.bind("<Configure>", self._on_image_frame_configure)
+
+        # Persistent equation scaffold: the static labels are created once
+        # and only the number texts and the two group canvases change per
+        # round. Hidden between rounds via grid_remove.
+        self._scaffold = tk.Frame(self.image_frame, bg=_BOARD_BG)
+        self._scaffold.grid(row=0, column=0)  # Centered via grid config
+        self._scaffold.grid_remove()
+
+        number_font = _font("Arial", 36, "bold")
+        plus_font = _font("Arial", 28, "bold")
+        self._num1_label = tk.Label(
+            self._scaffold, font=number_font, bg=_BOARD_BG, fg="#3498db"
+        )
+        self._num1_label.grid(row=0, column=0, padx=20, pady=10)
+        plus_label = tk.Label(
+            self._scaffold, text="➕", font=plus_font, bg=_BOARD_BG, fg="#2c3e50"
+        )
+        plus_label.grid(row=0, column=1, rowspan=2, padx=30, pady=10)
+        self._num2_label = tk.Label(
+            self._scaffold, font=number_font, bg=_BOARD_BG, fg="#3498db"
+        )
+        self._num2_label.grid(row=0, column=2, padx=20, pady=10)
+        equals_label = tk.Label(
+            self._scaffold, text="=", font=number_font, bg=_BOARD_BG, fg="#2c3e50"
+        )
+        equals_label.grid(row=0, column=3, rowspan=2, padx=30, pady=10)
+        self.question_label = tk.Label(
+            self._scaffold, text="❓", font=number_font, bg=_BOARD_BG, fg="#e74c3c"
+        )
+        self.question_label.grid(row=0, column=4, rowspan=2, padx=20, pady=10)
 
-        # Create new boxes
-        total_rounds = self.config.game_rounds
-        box_size = 20
-        for i in range(total_rounds):
-            box = tk.Canvas(
-                self.progress_frame,
-                width=box_size,
-                height=box_size,
-                bg="#f0f0f0",
-                highlightthickness=0,
-            )
-            box.create_rectangle(
-                2,
-                2,
-                box_size - 2,
-                box_size - 2,
-                fill="#bdc3c7",  # Gray
-                outline="#95a5a6",
-                tags="box",
-            )
-            box.grid(row=0, column=i, padx=2)
-            self.progress_boxes.append(box)
+        # The per-round group canvases occupy rows 1 of columns 0 and 2
+        self._group_canvases: list[tk.Canvas] = []
 
-    def _update_progress_box(self, round_num: int, is_correct: bool) -> None:
-        """Update a progress box color based on answer correctness."""
-        if 0 < round_num <= len(self.progress_boxes):
-            box = self.progress_boxes[round_num - 1]
-            color = "#2ecc71" if is_correct else "#e74c3c"  # Green or Red
-            box.delete("box")
-            box_size = 20
-            box.create_rectangle(
-                2,
-                2,
-                box_size - 2,
-                box_size - 2,
-                fill=color,
-                outline="#27ae60" if is_correct else "#c0392b",
-                tags="box",
-            )
+        # Answer buttons area (centered)
+        self.answer_frame = tk.Frame(self, bg=_BG)
+        self.answer_frame.grid(row=2, column=0, pady=(10, 30))
 
     def _next_round(self) -> None:
         """Set up the next round."""
         self.current_round += 1
-        total_rounds = self.config.game_rounds
+        total_rounds = self._rounds
 
         if self.current_round > total_rounds:
             self._show_results()
             return
 
-        # Clear previous content
-        for widget in self.image_frame.winfo_children():
-            widget.destroy()
+        # Clear previous content: the scaffold is merely hidden, and only
+        # the two per-round group canvases are destroyed
+        self._scaffold.grid_remove()
+        for canvas in self._group_canvases:
+            canvas.destroy()
+        self._group_canvases.clear()
         self.images.clear()
 
-        for widget in self.answer_frame.winfo_children():
-            widget.destroy()
-        self.answer_buttons.clear()
+        # Hide the pooled answer buttons (they are reconfigured next round)
+        for btn in self.answer_buttons:
+            btn.pack_forget()
 
         # Generate two random numbers that add up to max_number or less
-        max_sum = self.config.game_max_number
-        self.correct_answer = random.randint(2, max_sum)  # At least 2 so we can split
-        self.num1 = random.randint(1, self.correct_answer - 1)
+        max_sum = self._max_number
+        self.correct_answer = self._rng.randint(
+            2, max_sum
+        )  # At least 2 so we can split
+        self.num1 = self._rng.randint(1, self.correct_answer - 1)
         self.num2 = self.correct_answer - self.num1
 
-        # Store image path for delayed display
+        # Store image path for delayed display; decoding and resizing start
+        # in the background so the work overlaps with the game delay
         if self.available_images:
-            self._current_image_path = random.choice(self.available_images)
+            self._current_image_path = self._rng.choice(self.available_images)
+            # The target size reads widget geometry, so resolve it here on
+            # the Tk thread and hand the worker plain numbers
+            img_size = self._calculate_image_size(self.num1 + self.num2)
+            self._image_future = _decode_executor.submit(
+                self._prepare_image, self._current_image_path, img_size
+            )
         else:
             self._current_image_path = None
+            self._image_future = None
 
-        # Show images after delay, then answers after another delay
-        delay = self.config.game_delay
+        # Show images after delay, then answers after another delay. Both
+        # timers are armed up front, so the second reveal isn't delayed by
+        # an extra event-loop hop scheduled from inside the first callback.
+        delay = self._delay
         self.after(delay, self._show_addition_images)
+        self.after(delay * 2, self._create_answer_buttons)
 
     def _show_addition_images(self) -> None:
         """Display addition images after initial delay."""
@@ -1453,334 +1839,164 @@ class AdditionGameView(BaseView):
         else:
             self._display_addition_fallback()
 
-        # Show answer buttons after another delay
-        delay = self.config.game_delay
-        self.after(delay, self._create_answer_buttons)
-
     def _calculate_image_size(self, total_count: int) -> int:
         """Calculate appropriate image size based on count and available space."""
-        base_size = self.config.game_image_size
-
-        # Get available frame dimensions
-        self.image_frame.update_idletasks()
-        frame_height = self.image_frame.winfo_height()
-        frame_width = self.image_frame.winfo_width()
-
-        if frame_height < 50:  # Frame not yet sized
-            frame_height = 400
-        if frame_width < 50:
-            frame_width = 800
-
-        # For addition view: numbers on top row, images below
-        # Estimate: 2 rows max for images, need space for number labels (~80px) and plus/equals
-        available_height = frame_height - 100  # Reserve for number labels
-        max_rows = max(1, (max(self.num1, self.num2) + 4) // 5)  # Up to 5 per row
-        max_height_per_image = available_height // max(max_rows, 1)
-
-        # Width: need to fit both number groups + plus + equals + question
-        # Each group max 5 wide, plus symbols take ~200px
-        available_width = frame_width - 250  # Reserve for +, =, ?
-        max_width_per_image = available_width // 10  # 5 per group, 2 groups
+        # Use the size cached from <Configure> events; no forced layout pass
+        if self._frame_size is not None:
+            frame_width, frame_height = self._frame_size
+        else:
+            frame_width = self.image_frame.winfo_width()
+            frame_height = self.image_frame.winfo_height()
+
+        return _addition_image_size(
+            max(self.num1, self.num2),
+            frame_width,
+            frame_height,
+            self._image_size,
+        )
 
-        # Use the smaller of the two to ensure it fits
-        calculated_size = min(max_height_per_image, max_width_per_image, base_size)
+    @staticmethod
+    def _image_group_canvas(
+        parent: tk.Widget, count: int, photo: ImageTk.PhotoImage
+    ) -> tk.Canvas:
+        """Draw count copies of photo as items on a single canvas.
 
-        # Ensure minimum size
-        return max(30, int(calculated_size * 0.85))
+        Up to 5 per row, like the old per-label grid, but with one widget
+        instead of one Label per copy.
+        """
+        cols = min(count, 5)
+        rows = (count + cols - 1) // cols
+        cell_w = photo.width() + 6
+        cell_h = photo.height() + 6
+        canvas = tk.Canvas(
+            parent,
+            width=cols * cell_w,
+            height=rows * cell_h,
+            bg=_BOARD_BG,
+            highlightthickness=0,
+        )
+        for i in range(count):
+            r, c = divmod(i, cols)
+            canvas.create_image(
+                c * cell_w + cell_w // 2, r * cell_h + cell_h // 2, image=photo
+            )
+        return canvas
+
+    @staticmethod
+    def _circle_group_canvas(
+        parent: tk.Widget, count: int, img_size: int, color_offset: int = 0
+    ) -> tk.Canvas:
+        """Draw count colored circles as items on a single canvas."""
+        cols = min(count, 5)
+        rows = (count + cols - 1) // cols
+        cell = img_size + 6
+        canvas = tk.Canvas(
+            parent,
+            width=cols * cell,
+            height=rows * cell,
+            bg=_BOARD_BG,
+            highlightthickness=0,
+        )
+        for i in range(count):
+            r, c = divmod(i, cols)
+            x = c * cell + 3
+            y = r * cell + 3
+            color = _COLORS[(i + color_offset) % len(_COLORS)]
+            canvas.create_oval(
+                x + 5,
+                y + 5,
+                x + img_size - 5,
+                y + img_size - 5,
+                fill=color,
+                outline="",
+            )
+        return canvas
 
     def _display_addition(self, image_path: Path) -> None:
         """Display the addition with two groups of images."""
+        # Only the decode can reasonably fail; widget creation happens
+        # after the image is safely in hand, so a bad file can no longer
+        # leave a half-built round behind
         try:
-            total_count = self.num1 + self.num2
-            img_size = self._calculate_image_size(total_count)
-
-            # Load image and resize preserving aspect ratio
-            img = Image.open(image_path)
-            width, height = img.size
-            if width > height:
-                new_width = img_size
-                new_height = int(height * img_size / width)
+            # By now the background worker has usually finished; result()
+            # just hands the decoded image over
+            if self._image_future is not None:
+                img = self._image_future.result()
             else:
-                new_height = img_size
-                new_width = int(width * img_size / height)
-            img = img.resize((new_width, new_height), Image.Resampling.LANCZOS)
-
-            # Create main container centered via grid
-            inner_frame = tk.Frame(self.image_frame, bg="#ecf0f1")
-            inner_frame.grid(row=0, column=0)  # Centered via grid config
-
-            number_font = tkfont.Font(family="Arial", size=36, weight="bold")
-            plus_font = tkfont.Font(family="Arial", size=28, weight="bold")
-
-            # First number and its images
-            col = 0
-
-            # Number 1
-            num1_label = tk.Label(
-                inner_frame,
-                text=str(self.num1),
-                font=number_font,
-                bg="#ecf0f1",
-                fg="#3498db",
-            )
-            num1_label.grid(row=0, column=col, padx=20, pady=10)
-
-            # Images for num1
-            img1_frame = tk.Frame(inner_frame, bg="#ecf0f1")
-            img1_frame.grid(row=1, column=col, padx=20, pady=10)
-
-            cols1 = min(self.num1, 5)
-            for i in range(self.num1):
-                photo = ImageTk.PhotoImage(img)
-                self.images.append(photo)
-                label = tk.Label(img1_frame, image=photo, bg="#ecf0f1")
-                r = i // cols1
-                c = i % cols1
-                label.grid(row=r, column=c, padx=3, pady=3)
-
-            col += 1
-
-            # Plus sign
-            plus_label = tk.Label(
-                inner_frame, text="➕", font=plus_font, bg="#ecf0f1", fg="#2c3e50"
-            )
-            plus_label.grid(row=0, column=col, rowspan=2, padx=30, pady=10)
+                img = self._prepare_image(
+                    image_path, self._calculate_image_size(self.num1 + self.num2)
+                )
+        except Exception as e:
+            print(f"Error loading image: {e}")
+            self._display_addition_fallback()
+            return
 
-            col += 1
+        # One PhotoImage (pixmap) is shared by every copy in both groups;
+        # a single live reference keeps it alive
+        photo = ImageTk.PhotoImage(img)
+        self.images.append(photo)
 
-            # Number 2
-            num2_label = tk.Label(
-                inner_frame,
-                text=str(self.num2),
-                font=number_font,
-                bg="#ecf0f1",
-                fg="#3498db",
-            )
-            num2_label.grid(row=0, column=col, padx=20, pady=10)
-
-            # Images for num2
-            img2_frame = tk.Frame(inner_frame, bg="#ecf0f1")
-            img2_frame.grid(row=1, column=col, padx=20, pady=10)
-
-            cols2 = min(self.num2, 5)
-            for i in range(self.num2):
-                photo = ImageTk.PhotoImage(img)
-                self.images.append(photo)
-                label = tk.Label(img2_frame, image=photo, bg="#ecf0f1")
-                r = i // cols2
-                c = i % cols2
-                label.grid(row=r, column=c, padx=3, pady=3)
-
-            col += 1
-
-            # Equals sign
-            equals_label = tk.Label(
-                inner_frame, text="=", font=number_font, bg="#ecf0f1", fg="#2c3e50"
-            )
-            equals_label.grid(row=0, column=col, rowspan=2, padx=30, pady=10)
+        # Update the numbers and draw the two groups into the scaffold
+        self._num1_label.config(text=str(self.num1))
+        self._num2_label.config(text=str(self.num2))
 
-            col += 1
+        img1_canvas = self._image_group_canvas(self._scaffold, self.num1, photo)
+        img1_canvas.grid(row=1, column=0, padx=20, pady=10)
+        img2_canvas = self._image_group_canvas(self._scaffold, self.num2, photo)
+        img2_canvas.grid(row=1, column=2, padx=20, pady=10)
+        self._group_canvases = [img1_canvas, img2_canvas]
 
-            # Question mark (will be replaced by answer buttons)
-            self.question_label = tk.Label(
-                inner_frame, text="❓", font=number_font, bg="#ecf0f1", fg="#e74c3c"
-            )
-            self.question_label.grid(row=0, column=col, rowspan=2, padx=20, pady=10)
-
-        except Exception as e:
-            print(f"Error loading image: {e}")
-            self._display_addition_fallback()
+        self._scaffold.grid()
 
     def _display_addition_fallback(self) -> None:
         """Display addition with colored circles as fallback."""
         total_count = self.num1 + self.num2
         img_size = self._calculate_image_size(total_count)
 
-        inner_frame = tk.Frame(self.image_frame, bg="#ecf0f1")
-        inner_frame.grid(row=0, column=0)  # Centered via grid config
-
-        number_font = tkfont.Font(family="Arial", size=36, weight="bold")
-        plus_font = tkfont.Font(family="Arial", size=28, weight="bold")
+        # Update the numbers and draw the two circle groups into the
+        # scaffold
+        self._num1_label.config(text=str(self.num1))
+        self._num2_label.config(text=str(self.num2))
 
-        colors = ["#e74c3c", "#3498db", "#2ecc71", "#f39c12", "#9b59b6"]
-
-        col = 0
-
-        # Number 1
-        num1_label = tk.Label(
-            inner_frame,
-            text=str(self.num1),
-            font=number_font,
-            bg="#ecf0f1",
-            fg="#3498db",
-        )
-        num1_label.grid(row=0, column=col, padx=20, pady=10)
-
-        # Circles for num1
-        img1_frame = tk.Frame(inner_frame, bg="#ecf0f1")
-        img1_frame.grid(row=1, column=col, padx=20, pady=10)
-
-        cols1 = min(self.num1, 5)
-        for i in range(self.num1):
-            canvas = tk.Canvas(
-                img1_frame,
-                width=img_size,
-                height=img_size,
-                bg="#ecf0f1",
-                highlightthickness=0,
-            )
-            color = colors[i % len(colors)]
-            canvas.create_oval(5, 5, img_size - 5, img_size - 5, fill=color, outline="")
-            r = i // cols1
-            c = i % cols1
-            canvas.grid(row=r, column=c, padx=3, pady=3)
-
-        col += 1
-
-        # Plus sign
-        plus_label = tk.Label(
-            inner_frame, text="➕", font=plus_font, bg="#ecf0f1", fg="#2c3e50"
-        )
-        plus_label.grid(row=0, column=col, rowspan=2, padx=30, pady=10)
-
-        col += 1
-
-        # Number 2
-        num2_label = tk.Label(
-            inner_frame,
-            text=str(self.num2),
-            font=number_font,
-            bg="#ecf0f1",
-            fg="#3498db",
-        )
-        num2_label.grid(row=0, column=col, padx=20, pady=10)
-
-        # Circles for num2
-        img2_frame = tk.Frame(inner_frame, bg="#ecf0f1")
-        img2_frame.grid(row=1, column=col, padx=20, pady=10)
-
-        cols2 = min(self.num2, 5)
-        for i in range(self.num2):
-            canvas = tk.Canvas(
-                img2_frame,
-                width=img_size,
-                height=img_size,
-                bg="#ecf0f1",
-                highlightthickness=0,
-            )
-            color = colors[(i + self.num1) % len(colors)]
-            canvas.create_oval(5, 5, img_size - 5, img_size - 5, fill=color, outline="")
-            r = i // cols2
-            c = i % cols2
-            canvas.grid(row=r, column=c, padx=3, pady=3)
-
-        col += 1
-
-        # Equals sign
-        equals_label = tk.Label(
-            inner_frame, text="=", font=number_font, bg="#ecf0f1", fg="#2c3e50"
+        img1_canvas = self._circle_group_canvas(self._scaffold, self.num1, img_size)
+        img1_canvas.grid(row=1, column=0, padx=20, pady=10)
+        img2_canvas = self._circle_group_canvas(
+            self._scaffold, self.num2, img_size, color_offset=self.num1
         )
-        equals_label.grid(row=0, column=col, rowspan=2, padx=30, pady=10)
+        img2_canvas.grid(row=1, column=2, padx=20, pady=10)
+        self._group_canvases = [img1_canvas, img2_canvas]
 
-        col += 1
+        self._scaffold.grid()
 
-        # Question mark
-        self.question_label = tk.Label(
-            inner_frame, text="❓", font=number_font, bg="#ecf0f1", fg="#e74c3c"
+    def _answer_range(self) -> tuple[int, int]:
+        """Bounds for wrong-answer candidates (inclusive)."""
+        max_sum = self._max_number
+        return (
+            max(2, self.correct_answer - 3),
+            min(max_sum + 2, self.correct_answer + 3),
         )
-        self.question_label.grid(row=0, column=col, rowspan=2, padx=20, pady=10)
-
-    def _create_answer_buttons(self) -> None:
-        """Create three answer buttons with one correct answer."""
-        # Generate wrong answers
-        max_sum = self.config.game_max_number
-        min_val = max(2, self.correct_answer - 3)
-        max_val = min(max_sum + 2, self.correct_answer + 3)
-
-        wrong_answers = []
-        while len(wrong_answers) < 2:
-            num = random.randint(min_val, max_val)
-            if num != self.correct_answer and num not in wrong_answers and num >= 1:
-                wrong_answers.append(num)
 
-        # Combine and shuffle
-        answers = [self.correct_answer] + wrong_answers
-        random.shuffle(answers)
-
-        # Create buttons
-        button_font = tkfont.Font(family="Arial", size=36, weight="bold")
+    def _answer_colors(self) -> tuple[str, str]:
+        """Answer-button (background, active background) colors."""
         button_color = self.config.game_button_color
+        return button_color, button_color
 
-        for answer in answers:
-            btn = tk.Button(
-                self.answer_frame,
-                text=str(answer),
-                font=button_font,
-                width=4,
-                height=1,
-                bg=button_color,
-                fg="white",
-                activebackground=button_color,
-                activeforeground="white",
-                relief="flat",
-                cursor="hand2",
-                command=lambda a=answer: self._check_answer(a),
-            )
-            btn.pack(side="left", padx=20)
-            self.answer_buttons.append(btn)
-
-    def _check_answer(self, answer: int) -> None:
-        """Check if the selected answer is correct."""
-        is_correct = answer == self.correct_answer
-
-        # Record history
+    def _record_history(self, answer: int, is_correct: bool) -> None:
+        """Append the (num1, num2, correct, player, is_correct) record."""
         self.history.append(
-            {
-                "round": self.current_round,
-                "num1": self.num1,
-                "num2": self.num2,
-                "correct_answer": self.correct_answer,
-                "player_answer": answer,
-                "is_correct": is_correct,
-            }
+            (self.num1, self.num2, self.correct_answer, answer, is_correct)
         )
 
-        # Update progress box
-        self._update_progress_box(self.current_round, is_correct)
-
-        # Disable all buttons
-        for btn in self.answer_buttons:
-            btn.config(state="disabled", cursor="")
-
-        # Highlight buttons
-        for btn in self.answer_buttons:
-            btn_answer = int(btn.cget("text"))
-            if btn_answer == self.correct_answer:
-                btn.config(bg="#2ecc71")  # Green for correct
-            elif btn_answer == answer and not is_correct:
-                btn.config(bg="#e74c3c")  # Red for wrong selection
-
-        # Play sound only for correct answers (positive reinforcement)
-        if is_correct:
-            self.controller.sound_player.play_random_from_folder(
-                self.config.correct_sound_folder
-            )
-
-        # Schedule next round
-        delay = self.config.game_delay
-        self.after(delay, self._next_round)
-
-    def _show_results(self) -> None:
-        """Show the results screen."""
-        self.controller.show_view("addition_results", history=self.history)
-
 
 class AdditionResultsView(BaseView):
     """Results view for the addition game."""
 
     def __init__(self, parent: tk.Widget, controller: "GameController"):
         super().__init__(parent, controller)
-        self.history: list[dict] = []
+        # History records: (num1, num2, correct_answer, player_answer, is_correct)
+        self.history: list[tuple[int, int, int, int, bool]] = []
+        self._correct_count = 0
+        self._wrong_count = 0
         self.video_player: VideoPlayer | None = None
         self._setup_ui()
 
@@ -1792,78 +2008,68 @@ class AdditionResultsView(BaseView):
         self.grid_rowconfigure(2, weight=0)
 
         # Title
-        title_font = tkfont.Font(family="Arial", size=48, weight="bold")
+        title_font = _font("Arial", 48, "bold")
         self.title_label = tk.Label(
-            self, text="🏆", font=title_font, bg="#f0f0f0", fg="#2c3e50"
+            self, text="🏆", font=title_font, bg=_BG, fg="#2c3e50"
         )
         self.title_label.grid(row=0, column=0, columnspan=2, pady=(30, 20))
 
         # Main content area (will hold results on left, video on right)
-        self.content_frame = tk.Frame(self, bg="#f0f0f0")
+        self.content_frame = tk.Frame(self, bg=_BG)
         self.content_frame.grid(row=1, column=0, sticky="nsew", padx=20)
         self.content_frame.grid_columnconfigure(0, weight=1)
         self.content_frame.grid_columnconfigure(1, weight=1)
         self.content_frame.grid_rowconfigure(0, weight=1)
 
         # Results area (left side)
-        self.results_frame = tk.Frame(self.content_frame, bg="#f0f0f0")
+        self.results_frame = tk.Frame(self.content_frame, bg=_BG)
         self.results_frame.grid(row=0, column=0, sticky="nsew", padx=10)
 
         # Video area (right side) - will be populated when needed
-        self.video_container = tk.Frame(self.content_frame, bg="#f0f0f0")
+        self.video_container = tk.Frame(self.content_frame, bg=_BG)
         self.video_container.grid(row=0, column=1, sticky="nsew", padx=10)
 
-        # Button area
-        self.button_frame = tk.Frame(self, bg="#f0f0f0")
-        self.button_frame.grid(row=2, column=0, pady=30)
+        # Persistent score label and history grid; history entries are
+        # pooled and reconfigured on every show instead of rebuilt
+        self._score_label = tk.Label(
+            self.results_frame, font=_font("Arial", 32, "bold"), bg=_BG, fg="#2ecc71"
+        )
+        self._score_label.pack(pady=(0, 30))
+        self._history_frame = tk.Frame(self.results_frame, bg=_BG)
+        self._history_frame.pack()
+        # Pooled entries: (cell frame, equation label)
+        self._entry_pool: list[tuple[tk.Frame, tk.Label]] = []
 
-        button_font = tkfont.Font(family="Arial", size=20, weight="bold")
-        button_config = {
-            "font": button_font,
-            "width": 15,
-            "height": 2,
-            "relief": "flat",
-            "cursor": "hand2",
-        }
+        # Transient video container rebuilt on every show; destroying it
+        # tears down all its children in a single Tcl call
+        self._video_inner: tk.Frame | None = None
 
-        # Play again button
-        self.play_again_btn = tk.Button(
-            self.button_frame,
-            text="🔄",
-            bg="#2ecc71",
-            fg="white",
-            activebackground="#27ae60",
-            activeforeground="white",
-            command=self._on_play_again,
-            **button_config,
-        )
-        self.play_again_btn.pack(side="left", padx=20)
+        # Button area
+        self.button_frame = tk.Frame(self, bg=_BG)
+        self.button_frame.grid(row=2, column=0, pady=30)
 
-        # Main menu button
-        self.menu_btn = tk.Button(
-            self.button_frame,
-            text="🏠",
-            bg="#3498db",
-            fg="white",
-            activebackground="#2980b9",
-            activeforeground="white",
-            command=self._on_main_menu,
-            **button_config,
-        )
-        self.menu_btn.pack(side="left", padx=20)
+        button_font = _font("Arial", 20, "bold")
+        button_config = {**_BUTTON_BASE, "font": button_font}
 
-        # Exit button
-        self.exit_btn = tk.Button(
-            self.button_frame,
-            text="🚪",
-            bg="#e67e22",
-            fg="white",
-            activebackground="#d35400",
-            activeforeground="white",
-            command=self._on_exit,
-            **button_config,
+        # Play again / main menu / exit, built from one spec list
+        button_specs = [
+            ("🔄", "#2ecc71", "#27ae60", self._on_play_again),
+            ("🏠", "#3498db", "#2980b9", self._on_main_menu),
+            ("🚪", "#e67e22", "#d35400", self._on_exit),
+        ]
+        self.play_again_btn, self.menu_btn, self.exit_btn = (
+            tk.Button(
+                self.button_frame,
+                text=text,
+                bg=bg,
+                activebackground=active_bg,
+                command=command,
+                **button_config,
+            )
+            for text, bg, active_bg, command in button_specs
         )
-        self.exit_btn.pack(side="left", padx=20)
+        for btn in (self.play_again_btn, self.menu_btn, self.exit_btn):
+            btn.pack(side="left", padx=20)
 
     def _on_play_again(self) -> None:
         """Handle play again button."""
@@ -1887,15 +2093,19 @@ class AdditionResultsView(BaseView):
 
     def _check_video_reward(self) -> bool:
         """Check if player qualifies for video reward."""
-        total = len(self.history)
-        wrong_count = sum(1 for h in self.history if not h["is_correct"])
-
+        # Counts were tallied once in show(); no second history scan
+        total = self._correct_count + self._wrong_count
         min_rounds = self.config.video_min_rounds
         max_wrong = self.config.video_max_wrong
 
-        return total >= min_rounds and wrong_count <= max_wrong
+        return total >= min_rounds and self._wrong_count <= max_wrong
 
-    def show(self, history: list[dict] | None = None) -> None:
+    def show(
+        self,
+        history: list[tuple[int, int, int, int, bool]] | None = None,
+        correct_count: int | None = None,
+        wrong_count: int | None = None,
+    ) -> None:
         """Display the results."""
         if history is not None:
             self.history = history
@@ -1903,52 +2113,46 @@ class AdditionResultsView(BaseView):
         # Stop any previously playing video
         self._stop_video()
 
-        # Clear previous results
-        for widget in self.results_frame.winfo_children():
-            widget.destroy()
-        for widget in self.video_container.winfo_children():
-            widget.destroy()
-
-        # Calculate score
-        correct_count = sum(1 for h in self.history if h["is_correct"])
-        total = len(self.history)
+        # Clear the previous video by replacing its container wholesale
+        if self._video_inner is not None:
+            self._video_inner.destroy()
+        self._video_inner = tk.Frame(self.video_container, bg=_BG)
+        self._video_inner.pack(fill="both", expand=True)
+
+        # Use the counters the game view maintained round by round; fall
+        # back to one history scan when shown without them
+        if correct_count is None:
+            correct_count = sum(1 for rec in self.history if rec[-1])
+        if wrong_count is None:
+            wrong_count = len(self.history) - correct_count
+        total = correct_count + wrong_count
+        self._correct_count = correct_count
+        self._wrong_count = wrong_count
 
         # Score label
-        score_font = tkfont.Font(family="Arial", size=32, weight="bold")
-        score_text = f"✅ {correct_count} / {total}"
-        score_label = tk.Label(
-            self.results_frame,
-            text=score_text,
-            font=score_font,
-            bg="#f0f0f0",
-            fg="#2ecc71",
-        )
-        score_label.pack(pady=(0, 30))
+        self._score_label.config(text=f"✅ {correct_count} / {total}")
 
-        # History display
-        history_frame = tk.Frame(self.results_frame, bg="#f0f0f0")
-        history_frame.pack()
+        # History display: recycle pooled entry widgets, growing the pool as
+        # needed and hiding any surplus from a longer previous session
+        result_font = _font("Arial", 20, "bold")
 
-        result_font = tkfont.Font(family="Arial", size=20, weight="bold")
+        for idx, (num1, num2, correct_answer, _, ok) in enumerate(self.history):
+            if idx == len(self._entry_pool):
+                frame = tk.Frame(self._history_frame, padx=15, pady=10)
+                label = tk.Label(frame, font=result_font, fg="white")
+                label.pack()
+                self._entry_pool.append((frame, label))
+            frame, label = self._entry_pool[idx]
 
-        for idx, entry in enumerate(self.history):
-            color = "#2ecc71" if entry["is_correct"] else "#e74c3c"
-
-            frame = tk.Frame(history_frame, bg=color, padx=15, pady=10)
-            row = idx // 5
-            col = idx % 5
-            frame.grid(row=row, column=col, padx=5, pady=10)
+            color = "#2ecc71" if ok else "#e74c3c"
+            frame.config(bg=color)
+            frame.grid(row=idx // 5, column=idx % 5, padx=5, pady=10)
 
             # Show the equation
-            equation = f"{entry['num1']}+{entry['num2']}={entry['correct_answer']}"
-            label = tk.Label(
-                frame,
-                text=equation,
-                font=result_font,
-                bg=color,
-                fg="white",
-            )
-            label.pack()
+            label.config(text=f"{num1}+{num2}={correct_answer}", bg=color)
+
+        for frame, _ in self._entry_pool[len(self.history) :]:
+            frame.grid_remove()
 
         # Check for video reward
         if self._check_video_reward():
@@ -1956,7 +2160,7 @@ class AdditionResultsView(BaseView):
 
     def _play_video_reward(self) -> None:
         """Play a video reward if available."""
-        self.video_player = VideoPlayer(self.video_container, self.config)
+        self.video_player = VideoPlayer(self._video_inner, self.config)
 
         if not self.video_player.is_available():
             return
@@ -1966,11 +2170,18 @@ class AdditionResultsView(BaseView):
             return
 
         # Create video frame
-        video_frame = self.video_player.create_frame(self.video_container)
+        video_frame = self.video_player.create_frame(self._video_inner)
         video_frame.pack(fill="both", expand=True, pady=20)
 
-        # Start playback after a short delay to ensure frame is ready
-        self.after(100, lambda: self.video_player.play(video_path))
+        def _start_playback(event: tk.Event) -> None:
+            # Once only: the frame can be mapped again when the window is
+            # restored, and the video must not restart then
+            video_frame.unbind("<Map>")
+            self.video_player.play(video_path)
+
+        # Start playback the moment the frame is realized on screen instead
+        # of guessing with a fixed delay
+        video_frame.bind("<Map>", _start_playback)
 
 
 class GameController:
@@ -1981,8 +2192,9 @@ class GameController:
         self.config = config
         self.sound_player = SoundPlayer(config.sound_enabled)
 
-        # Pre-initialize VLC so first video playback is instant
-        VideoPlayer.warmup()
+        # Pre-initialize VLC in the background so first video playback is
+        # instant without blocking startup
+        VideoPlayer.warmup_async()
 
         # Configure main window
         self._setup_window()
@@ -2011,7 +2223,7 @@ class GameController:
         if self.config.fullscreen:
             self.root.attributes("-fullscreen", True)
 
-        self.root.configure(bg="#f0f0f0")
+        self.root.configure(bg=_BG)
 
         # Handle escape key to exit fullscreen or quit
         self.root.bind("<Escape>", self._on_escape)
@@ -2028,8 +2240,12 @@ class GameController:
         self.root.quit()
 
     def _create_views(self) -> None:
-        """Create all game views."""
-        view_classes = {
+        """Register all game views, building only the main menu eagerly.
+
+        The other views are constructed lazily on their first show, so cold
+        start only pays for the screen that is actually visible.
+        """
+        self._view_classes: dict[str, type[BaseView]] = {
             "main_menu": MainMenuView,
             "settings": SettingsView,
             "counting": CountingGameView,
@@ -2037,22 +2253,27 @@ class GameController:
             "addition": AdditionGameView,
             "addition_results": AdditionResultsView,
         }
+        self._build_view("main_menu")
 
-        for name, view_class in view_classes.items():
-            view = view_class(self.container, self)
-            view.grid(row=0, column=0, sticky="nsew")
-            self.views[name] = view
+    def _build_view(self, name: str) -> BaseView:
+        """Construct, grid and cache the view registered under name."""
+        view = self._view_classes[name](self.container, self)
+        view.grid(row=0, column=0, sticky="nsew")
+        self.views[name] = view
+        return view
 
     def show_view(self, view_name: str, **kwargs) -> None:
-        """Show a specific view.
+        """Show a specific view (constructing it on first use).
 
         Args:
             view_name: Name of the view to show
             **kwargs: Additional arguments to pass to the view's show method
         """
         if view_name not in self.views:
-            print(f"Unknown view: {view_name}")
-            return
+            if view_name not in self._view_classes:
+                print(f"Unknown view: {view_name}")
+                return
+            self._build_view(view_name)
 
         # Hide current view
         if self.current_view is not None: